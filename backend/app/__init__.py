@@ -309,7 +309,8 @@ def _update_ytdlp_async() -> None:
 
 
 def _shutdown(app: FastAPI) -> None:
-    """Gracefully shut down the scheduler and worker threads."""
+    """Gracefully shut down the scheduler, worker and notification threads."""
+    from app.services.notifications import NotificationService
     from app.task_queue import get_worker
 
     if hasattr(app.state, "scheduler") and app.state.scheduler.running:
@@ -318,3 +319,5 @@ def _shutdown(app: FastAPI) -> None:
     worker = get_worker()
     if worker:
         worker.stop()
+
+    NotificationService.shutdown()
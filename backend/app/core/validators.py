@@ -1,5 +1,7 @@
 """Validation functions."""
 
+import json
+
 from app.core.constants import SPONSORBLOCK_BEHAVIOURS, SPONSORBLOCK_CATEGORIES
 from app.core.exceptions import ValidationError
 
@@ -55,8 +57,6 @@ def validate_extra_args(extra_args: dict | None) -> None:
     Raises:
         ValidationError: If not a dict or not JSON serialisable.
     """
-    import json
-
     if extra_args is None:
         return
 
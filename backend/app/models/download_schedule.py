@@ -58,8 +58,6 @@ class DownloadSchedule(Base):
         If schedules exist but none are enabled, downloads are always allowed.
         If enabled schedules exist, downloads are only allowed during scheduled windows.
         """
-        from datetime import datetime
-
         schedules = db.query(cls).filter_by(enabled=True).all()
 
         # No enabled schedules = always allow
@@ -3,6 +3,7 @@
 from sqlalchemy import Column, String, Text
 
 from app.models import Base
+from app.models.versioning import track_version
 
 # Setting keys
 SETTING_DATA_RETENTION_DAYS = "data_retention_days"
@@ -51,7 +52,19 @@ class Settings(Base):
         Returns:
             The boolean value.
         """
-        value = cls.get(db, key, str(default).lower())
+        return cls.parse_bool(cls.get(db, key, str(default).lower()))
+
+    @staticmethod
+    def parse_bool(value: str) -> bool:
+        """
+        Interpret a stored setting value as a boolean.
+
+        Args:
+            value: The raw setting value.
+
+        Returns:
+            True for "true", "1" or "yes" (any case), otherwise False.
+        """
         return value.lower() in ("true", "1", "yes")
 
     @classmethod
@@ -118,3 +131,8 @@ class Settings(Base):
             commit: Whether to commit the transaction.
         """
         cls.set(db, key, str(value), commit=commit)
+
+
+# Bumped whenever a transaction that wrote settings commits, so readers can cache
+# settings until the next change
+settings_version = track_version(Settings)
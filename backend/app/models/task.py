@@ -22,6 +22,7 @@ from sqlalchemy import (
 from sqlalchemy.orm import relationship
 
 from app.models import Base
+from app.models.versioning import track_version
 
 
 class TaskStatus(str, Enum):
@@ -292,3 +293,8 @@ class TaskLog(Base):
             "message": self.message,
             "created_at": self.created_at.isoformat(),
         }
+
+
+# Bumped whenever a transaction that wrote tasks commits, so readers can cache
+# task-derived data until the next change
+tasks_version = track_version(Task)
@@ -0,0 +1,75 @@
+"""
+Process-wide change counters for model tables.
+
+A tracked model's counter is bumped whenever a transaction that wrote rows of
+that model commits, so readers can cache data derived from the table until
+the next change. Covers both unit-of-work flushes and bulk
+query().update()/delete() calls. Rolled-back writes leave counters alone.
+
+One set of Session listeners serves every tracked model.
+"""
+
+import threading
+from collections.abc import Callable
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+_lock = threading.Lock()
+_versions: dict[type, int] = {}
+
+# Session.info key holding the tracked models written in the current transaction
+_CHANGED_KEY = "changed_models"
+
+
+def track_version(model: type) -> Callable[[], int]:
+    """
+    Start counting committed writes to a model's table.
+
+    Args:
+        model: The mapped model class to track.
+
+    Returns:
+        A function returning the model's current version.
+    """
+    with _lock:
+        _versions.setdefault(model, 0)
+
+    def version() -> int:
+        return _versions[model]
+
+    return version
+
+
+def _mark_changed(session, model: type) -> None:
+    session.info.setdefault(_CHANGED_KEY, set()).add(model)
+
+
+@event.listens_for(Session, "after_flush")
+def _track_flush(session, flush_context) -> None:
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if type(obj) in _versions:
+            _mark_changed(session, type(obj))
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _track_bulk_write(orm_execute_state) -> None:
+    if orm_execute_state.is_select:
+        return
+    for mapper in orm_execute_state.all_mappers:
+        if mapper.class_ in _versions:
+            _mark_changed(orm_execute_state.session, mapper.class_)
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_versions(session) -> None:
+    changed = session.info.pop(_CHANGED_KEY, None)
+    if changed:
+        with _lock:
+            for model in changed:
+                _versions[model] += 1
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changes(session) -> None:
+    session.info.pop(_CHANGED_KEY, None)
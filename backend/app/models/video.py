@@ -60,6 +60,21 @@ class Video(Base):
         Index("ix_videos_list_updated", "list_id", "updated_at"),
         Index("ix_videos_list_failed", "list_id", "downloaded", "error_message"),
         Index("ix_videos_list_id_updated", "list_id", "id", "updated_at"),
+        # Serves the video page ordering (upload_date DESC NULLS LAST, id DESC)
+        # without a sort. SQLite already orders NULLs last for DESC and rejects
+        # NULLS LAST in index definitions; PostgreSQL needs it spelled out.
+        Index(
+            "ix_videos_list_upload_date",
+            "list_id",
+            desc("upload_date"),
+            desc("id"),
+        ).ddl_if(dialect="sqlite"),
+        Index(
+            "ix_videos_list_upload_date",
+            "list_id",
+            upload_date.desc().nulls_last(),
+            desc("id"),
+        ).ddl_if(dialect="postgresql"),
     )
 
     def to_dict(self) -> dict:
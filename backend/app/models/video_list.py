@@ -87,6 +87,7 @@ class VideoList(Base):
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialisation."""
+        next_sync_at = self.next_sync_at()
         return {
             "id": self.id,
             "name": self.name,
@@ -100,9 +101,7 @@ class VideoList(Base):
             "enabled": self.enabled,
             "auto_download": self.auto_download,
             "last_synced": self.last_synced.isoformat() if self.last_synced else None,
-            "next_sync_at": self.next_sync_at().isoformat()
-            if self.next_sync_at()
-            else None,
+            "next_sync_at": next_sync_at.isoformat() if next_sync_at else None,
             "description": self.description,
             "thumbnail": self.thumbnail,
             "tags": self.tags.split(",") if self.tags else [],
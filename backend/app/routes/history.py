@@ -3,6 +3,7 @@ History routes.
 """
 
 from fastapi import APIRouter, Query, Request
+from fastapi.responses import JSONResponse
 
 from app.core.helpers import calculate_total_pages
 from app.extensions import ReadSessionLocal
@@ -76,10 +77,14 @@ async def get_history(
       includes 'text/event-stream'
     """
     if not wants_sse(request):
-        return _fetch_history_paginated(entity_type, action, search, page, page_size)
+        # Entries are built by History.to_dict(); skip response_model validation
+        return JSONResponse(
+            _fetch_history_paginated(entity_type, action, search, page, page_size)
+        )
 
     return sse_response(
         request,
         Channel.HISTORY,
         lambda: _fetch_history_paginated(entity_type, action, search, page, page_size),
+        cache_key=(entity_type, action, search, page, page_size),
     )
@@ -3,12 +3,12 @@ Lists routes.
 """
 
 import asyncio
-import json
 import threading
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from fastapi import APIRouter, BackgroundTasks, Depends, Query, Request, status
-from sqlalchemy import exists, func, select
+from fastapi.responses import JSONResponse
+from sqlalchemy import bindparam, exists, func, select, tuple_, union_all
 from sqlalchemy.orm import Session, load_only
 from sse_starlette.sse import EventSourceResponse
 
@@ -18,7 +18,7 @@ from app.core.logging import get_logger
 from app.extensions import ReadSessionLocal, SessionLocal, get_db, sse_executor
 from app.models import HistoryAction, Profile, VideoList
 from app.models.history import History
-from app.models.task import Task, TaskStatus, TaskType
+from app.models.task import Task, TaskStatus, TaskType, tasks_version
 from app.models.video import Video
 from app.schemas.common import DeletionStartedResponse
 from app.schemas.lists import (
@@ -35,7 +35,13 @@ from app.schemas.videos import VideoResponse
 from app.services import HistoryService
 from app.services.ytdlp_service import YtDlpService
 from app.sse_hub import Channel, broadcast, hub
-from app.sse_stream import sse_cors_headers, sse_response, wants_sse
+from app.sse_stream import (
+    SSE_HEARTBEAT,
+    encode_sse_data,
+    sse_cors_headers,
+    sse_response,
+    wants_sse,
+)
 from app.tasks import enqueue_task
 
 logger = get_logger("routes.lists")
@@ -43,6 +49,78 @@ router = APIRouter(prefix="/api/lists", tags=["Lists"])
 
 ACTIVE_TASK_STATUSES = (TaskStatus.PENDING.value, TaskStatus.RUNNING.value)
 
+# Last active tasks per list, tagged with the task table version they reflect.
+# Only entries for the current version are kept, so it holds at most the lists
+# fetched since tasks last changed.
+_active_tasks_cache: dict[int, tuple[int, dict]] = {}
+_active_tasks_lock = threading.Lock()
+
+# How far behind its watermark the stats stream re-checks for late commits
+CHANGE_LOOKBACK = timedelta(seconds=5)
+
+# Statements run on every stats stream update, built once at import so each
+# call only binds parameters instead of rebuilding the select
+_VIDEO_STATS_STMT = select(
+    func.count(Video.id).label("total"),
+    func.count().filter(Video.downloaded.is_(True)).label("downloaded"),
+    func.count()
+    .filter(Video.downloaded.is_(False), Video.error_message.isnot(None))
+    .label("failed"),
+    func.count().filter(Video.blacklisted.is_(True)).label("blacklisted"),
+    func.max(Video.id).label("newest_id"),
+    func.max(Video.updated_at).label("last_updated"),
+).where(Video.list_id == bindparam("list_id"))
+
+# Sync tasks target the list itself, download tasks target its videos.
+# Fetch both in a single round-trip. Download tasks only need a membership
+# test against the list, so use EXISTS rather than joining video rows in.
+_ACTIVE_TASK_COLUMNS = (Task.task_type, Task.status, Task.entity_id)
+_ACTIVE_TASKS_STMT = union_all(
+    select(*_ACTIVE_TASK_COLUMNS).where(
+        Task.task_type == TaskType.SYNC.value,
+        Task.entity_id == bindparam("list_id"),
+        Task.status.in_(ACTIVE_TASK_STATUSES),
+    ),
+    select(*_ACTIVE_TASK_COLUMNS).where(
+        Task.task_type == TaskType.DOWNLOAD.value,
+        Task.status.in_(ACTIVE_TASK_STATUSES),
+        exists().where(
+            Video.id == Task.entity_id,
+            Video.list_id == bindparam("list_id"),
+        ),
+    ),
+)
+
+_CHANGED_VIDEOS_STMT = (
+    select(Video.id, Video.updated_at)
+    .where(
+        Video.list_id == bindparam("list_id"),
+        tuple_(Video.updated_at, Video.id)
+        > tuple_(
+            bindparam("since_updated", type_=Video.updated_at.type),
+            bindparam("since_id", type_=Video.id.type),
+        ),
+    )
+    .order_by(Video.updated_at, Video.id)
+    .limit(bindparam("limit"))
+)
+
+# Columns needed to render a video in a list page
+VIDEO_SUMMARY_COLUMNS = (
+    Video.id,
+    Video.video_id,
+    Video.title,
+    Video.duration,
+    Video.upload_date,
+    Video.media_type,
+    Video.thumbnail,
+    Video.downloaded,
+    Video.blacklisted,
+    Video.error_message,
+    Video.labels,
+    Video.filesize,
+)
+
 
 def _reapply_blacklist_background(
     list_id: int,
@@ -75,8 +153,9 @@ def _reapply_blacklist_background(
 
     with SessionLocal() as db:
         try:
-            # Process in batches using offset
-            offset = 0
+            # Process in batches, seeking past the last ID seen so each batch
+            # is an index range scan rather than an ever-growing OFFSET
+            last_id = 0
             while True:
                 videos = (
                     db.query(Video)
@@ -89,9 +168,8 @@ def _reapply_blacklist_background(
                             Video.error_message,
                         )
                     )
-                    .filter(Video.list_id == list_id)
+                    .filter(Video.list_id == list_id, Video.id > last_id)
                     .order_by(Video.id)
-                    .offset(offset)
                     .limit(BATCH_SIZE)
                     .all()
                 )
@@ -139,7 +217,7 @@ def _reapply_blacklist_background(
                     # Notify after each batch so UI updates progressively
                     broadcast(Channel.list_videos(list_id), Channel.TASKS)
 
-                offset += BATCH_SIZE
+                last_id = videos[-1].id
                 time.sleep(0.05)  # yield time to other connections
 
             if total_changed:
@@ -163,20 +241,7 @@ def _list_exists(db: Session, list_id: int) -> bool:
 
 def _fetch_video_stats(db: Session, list_id: int) -> dict:
     """Fetch list stats."""
-    stats = (
-        db.query(
-            func.count(Video.id).label("total"),
-            func.count().filter(Video.downloaded.is_(True)).label("downloaded"),
-            func.count()
-            .filter(Video.downloaded.is_(False), Video.error_message.isnot(None))
-            .label("failed"),
-            func.count().filter(Video.blacklisted.is_(True)).label("blacklisted"),
-            func.max(Video.id).label("newest_id"),
-            func.max(Video.updated_at).label("last_updated"),
-        )
-        .filter(Video.list_id == list_id)
-        .one()
-    )
+    stats = db.execute(_VIDEO_STATS_STMT, {"list_id": list_id}).one()
 
     total = stats.total or 0
     downloaded = stats.downloaded or 0
@@ -202,50 +267,69 @@ def _fetch_active_tasks(db: Session, list_id: int) -> dict:
         "download": {"pending": [], "running": []},
     }
 
-    # Sync tasks
-    sync_rows = (
-        db.query(Task.status, Task.entity_id)
-        .filter(
-            Task.task_type == TaskType.SYNC.value,
-            Task.entity_id == list_id,
-            Task.status.in_(ACTIVE_TASK_STATUSES),
-        )
-        .all()
-    )
-    for task_status, entity_id in sync_rows:
-        if task_status in result["sync"]:
-            result["sync"][task_status].append(entity_id)
-
-    # Download tasks
-    download_rows = (
-        db.query(Task.status, Task.entity_id)
-        .join(Video, Task.entity_id == Video.id)
-        .filter(
-            Task.task_type == TaskType.DOWNLOAD.value,
-            Video.list_id == list_id,
-            Task.status.in_(ACTIVE_TASK_STATUSES),
-        )
-        .all()
-    )
-    for task_status, entity_id in download_rows:
-        if task_status in result["download"]:
-            result["download"][task_status].append(entity_id)
+    # Plain iteration, not yield_per: this runs on the autocommit read engine,
+    # where PostgreSQL's server-side cursors are not allowed
+    for task_type, task_status, entity_id in db.execute(
+        _ACTIVE_TASKS_STMT, {"list_id": list_id}
+    ):
+        by_status = result.get(task_type)
+        if by_status is not None and task_status in by_status:
+            by_status[task_status].append(entity_id)
 
     return result
 
 
-def _fetch_changed_video_ids(
-    db: Session, list_id: int, since: datetime, limit: int = 100
-) -> list[int]:
-    """Fetch video IDs updated since a given timestamp."""
-    rows = (
-        db.query(Video.id)
-        .filter(Video.list_id == list_id, Video.updated_at > since)
-        .order_by(Video.updated_at.desc())
-        .limit(limit)
-        .all()
-    )
-    return [row[0] for row in rows]
+def _fetch_active_tasks_cached(db: Session, list_id: int) -> dict:
+    """
+    Fetch active tasks for a list, reusing the last result until tasks change.
+
+    Most notifications on a list's video channel are video updates (e.g. sync
+    progress), so the task queries are skipped while the task table version
+    is unchanged. The cache is shared by every stream watching the list.
+    """
+    # Read the version first: a write landing mid-query leaves the entry stale
+    # against the new version rather than caching new data under the old one
+    version = tasks_version()
+    cached = _active_tasks_cache.get(list_id)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    tasks = _fetch_active_tasks(db, list_id)
+    with _active_tasks_lock:
+        # Entries from an older version can never be served again
+        stale = [
+            key
+            for key, (cached_version, _) in _active_tasks_cache.items()
+            if cached_version != version
+        ]
+        for key in stale:
+            del _active_tasks_cache[key]
+        _active_tasks_cache[list_id] = (version, tasks)
+    return tasks
+
+
+def _fetch_changed_videos(
+    db: Session, list_id: int, since: tuple[datetime, int], limit: int = 100
+) -> list[tuple[int, datetime]]:
+    """
+    Fetch videos updated after an (updated_at, id) watermark, oldest first.
+
+    Ordering by the full watermark key means a capped batch never skips rows:
+    the next call resumes from the last row returned.
+    """
+    since_updated, since_id = since
+    return [
+        (video_id, updated_at)
+        for video_id, updated_at in db.execute(
+            _CHANGED_VIDEOS_STMT,
+            {
+                "list_id": list_id,
+                "since_updated": since_updated,
+                "since_id": since_id,
+                "limit": limit,
+            },
+        )
+    ]
 
 
 def _fetch_all_lists() -> list[dict]:
@@ -612,10 +696,11 @@ def create_lists_bulk(
 async def list_all(request: Request):
     """Get all lists. Supports SSE streaming."""
     if not wants_sse(request):
-        with ReadSessionLocal() as db:
-            return [vl.to_dict() for vl in db.query(VideoList).all()]
+        # to_dict output already matches ListResponse; returning a response
+        # directly skips re-validating every row against the model
+        return JSONResponse(_fetch_all_lists())
 
-    return sse_response(request, Channel.LISTS, _fetch_all_lists)
+    return sse_response(request, Channel.LISTS, _fetch_all_lists, cache_key="all")
 
 
 @router.get("/{list_id}", response_model=ListResponse)
@@ -631,7 +716,7 @@ async def get_list(list_id: int):
     result = await loop.run_in_executor(sse_executor, _fetch)
     if result is None:
         raise NotFoundError("VideoList", list_id)
-    return result
+    return JSONResponse(result)
 
 
 @router.put("/{list_id}", response_model=ListResponse)
@@ -774,6 +859,7 @@ def _delete_list_background(list_id: int, list_name: str):
             if video_list:
                 db.delete(video_list)
                 db.commit()
+            _active_tasks_cache.pop(list_id, None)
 
             # Log deletion in history
             HistoryService.log(
@@ -885,6 +971,7 @@ async def get_list_tasks(
         request,
         Channel.list_tasks(list_id),
         lambda: _fetch_list_tasks(list_id, page, page_size, search),
+        cache_key=(page, page_size, search),
     )
 
 
@@ -904,6 +991,7 @@ async def get_list_history(
         request,
         Channel.list_history(list_id),
         lambda: _fetch_list_history(list_id, page, page_size, search),
+        cache_key=(page, page_size, search),
     )
 
 
@@ -915,81 +1003,84 @@ def _fetch_videos_paginated(
     failed: bool | None = None,
     blacklisted: bool | None = None,
     search: str | None = None,
+    db: Session | None = None,
 ) -> dict:
-    """Fetch paginated videos for SSE streaming."""
-    with ReadSessionLocal() as db:
-        query = db.query(Video).filter(Video.list_id == list_id)
+    """
+    Fetch paginated videos for a list.
 
-        # Apply filters
-        if downloaded is not None:
-            query = query.filter(Video.downloaded == downloaded)
+    Opens its own read session unless one is passed in, so callers that have
+    already queried (e.g. the existence check) can reuse their connection.
+    """
+    if db is None:
+        with ReadSessionLocal() as db:
+            return _fetch_videos_paginated(
+                list_id,
+                page,
+                page_size,
+                downloaded,
+                failed,
+                blacklisted,
+                search,
+                db=db,
+            )
 
-        if failed is True:
-            query = query.filter(Video.error_message.isnot(None))
-        elif failed is False:
-            query = query.filter(Video.error_message.is_(None))
+    query = db.query(Video).filter(Video.list_id == list_id)
 
-        if blacklisted is not None:
-            query = query.filter(Video.blacklisted == blacklisted)
+    # Apply filters
+    if downloaded is not None:
+        query = query.filter(Video.downloaded == downloaded)
 
-        if search:
-            pattern = f"%{search}%"
-            query = query.filter(Video.title.ilike(pattern))
+    if failed is True:
+        query = query.filter(Video.error_message.isnot(None))
+    elif failed is False:
+        query = query.filter(Video.error_message.is_(None))
 
-        # Total count for pagination
-        total = query.count()
-        total_pages = calculate_total_pages(total, page_size)
+    if blacklisted is not None:
+        query = query.filter(Video.blacklisted == blacklisted)
 
-        # Fetch paginated rows
-        rows = (
-            query.options(
-                load_only(
-                    Video.id,
-                    Video.video_id,
-                    Video.title,
-                    Video.duration,
-                    Video.upload_date,
-                    Video.media_type,
-                    Video.thumbnail,
-                    Video.downloaded,
-                    Video.blacklisted,
-                    Video.error_message,
-                    Video.labels,
-                    Video.filesize,
-                )
-            )
-            .order_by(Video.upload_date.desc().nulls_last(), Video.id.desc())
-            .offset((page - 1) * page_size)
-            .limit(page_size)
-            .all()
-        )
+    if search:
+        pattern = f"%{search}%"
+        query = query.filter(Video.title.ilike(pattern))
 
-        # Convert to dict
-        videos = [
-            {
-                "id": v.id,
-                "video_id": v.video_id,
-                "title": v.title,
-                "duration": v.duration,
-                "upload_date": v.upload_date.isoformat() if v.upload_date else None,
-                "media_type": v.media_type,
-                "thumbnail": v.thumbnail,
-                "downloaded": v.downloaded,
-                "blacklisted": v.blacklisted,
-                "error_message": v.error_message,
-                "labels": v.labels or {},
-                "filesize": v.filesize,
-            }
-            for v in rows
-        ]
+    # Total count for pagination
+    total = query.count()
+    total_pages = calculate_total_pages(total, page_size)
 
-        return {
-            "videos": videos,
-            "total": total,
-            "page": page,
-            "page_size": page_size,
-            "total_pages": total_pages,
+    # Fetch paginated rows as plain column tuples, skipping ORM hydration
+    rows = (
+        query.with_entities(*VIDEO_SUMMARY_COLUMNS)
+        .order_by(Video.upload_date.desc().nulls_last(), Video.id.desc())
+        .offset((page - 1) * page_size)
+        .limit(page_size)
+        .all()
+    )
+
+    # Convert to dict
+    videos = [
+        {
+            "id": v.id,
+            "video_id": v.video_id,
+            "title": v.title,
+            "duration": v.duration,
+            "upload_date": v.upload_date.isoformat() if v.upload_date else None,
+            "media_type": v.media_type,
+            "thumbnail": v.thumbnail,
+            "downloaded": v.downloaded,
+            "blacklisted": v.blacklisted,
+            "error_message": v.error_message,
+            "labels": v.labels or {},
+            "filesize": v.filesize,
         }
+        for v in rows
+    ]
+
+    return {
+        "videos": videos,
+        "total": total,
+        "page": page,
+        "page_size": page_size,
+        "total_pages": total_pages,
+    }
 
 
 @router.get("/{list_id}/videos", response_model=VideosPaginatedResponse)
@@ -1018,6 +1109,7 @@ async def get_videos_page(
             lambda: _fetch_videos_paginated(
                 list_id, page, page_size, downloaded, failed, blacklisted, search
             ),
+            cache_key=(page, page_size, downloaded, failed, blacklisted, search),
         )
 
     # Regular JSON response
@@ -1025,11 +1117,14 @@ async def get_videos_page(
         if not _list_exists(db, list_id):
             raise NotFoundError("VideoList", list_id)
 
-        # Delegate filtering & pagination to the optimised function
-        result = _fetch_videos_paginated(
-            list_id, page, page_size, downloaded, failed, blacklisted, search
+        # Delegate filtering & pagination to the optimised function, reusing
+        # the session from the existence check. The rows are our own, so the
+        # labels JSON goes out as loaded rather than being re-validated.
+        return JSONResponse(
+            _fetch_videos_paginated(
+                list_id, page, page_size, downloaded, failed, blacklisted, search, db=db
+            )
         )
-        return result
 
 
 @router.get("/{list_id}/videos/stats", response_model=ListVideoStatsResponse)
@@ -1057,25 +1152,78 @@ async def get_list_video_stats(list_id: int, request: Request):
 
     async def generate_sse_stream():
         event_loop = asyncio.get_running_loop()
-        last_change_check = datetime.utcnow()
         heartbeat_interval = 30
+        changed_batch_size = 100
+        # updated_at is stamped at flush time, so a slow transaction can commit
+        # a row older than one already sent. Re-scan a short window behind the
+        # watermark and skip rows this client has already been sent.
+        state: dict = {
+            "watermark": datetime.utcnow(),
+            "sent": {},
+            "stats": None,
+            "tasks": None,
+        }
+        # One session for the life of the stream. Leaving the with block on
+        # each update closes it, handing the connection back to the pool
+        # between updates, and the session is reusable after close.
+        db = ReadSessionLocal()
+
+        def fetch_payload() -> tuple[dict | None, bool]:
+            sent: dict[int, datetime] = state["sent"]
+            window_start = state["watermark"] - CHANGE_LOOKBACK
+            with db:
+                rows = _fetch_changed_videos(
+                    db,
+                    list_id,
+                    (window_start, 0),
+                    limit=changed_batch_size + len(sent),
+                )
+                changed = [
+                    (video_id, updated_at)
+                    for video_id, updated_at in rows
+                    if sent.get(video_id) != updated_at
+                ][:changed_batch_size]
+                tasks = _fetch_active_tasks_cached(db, list_id)
+
+                # Every change that moves the stats also bumps updated_at, so
+                # with no changed rows the full-list aggregate can be skipped,
+                # and with the tasks unchanged too there is nothing to send
+                if changed or state["stats"] is None:
+                    state["stats"] = _fetch_video_stats(db, list_id)
+                elif tasks is state["tasks"]:
+                    return None, False
+                state["tasks"] = tasks
+
+                payload = {
+                    "stats": state["stats"],
+                    "tasks": tasks,
+                    "changed_video_ids": [video_id for video_id, _ in changed],
+                }
 
-        def fetch_payload(since_timestamp: datetime):
-            with ReadSessionLocal() as db:
-                return {
-                    "stats": _fetch_video_stats(db, list_id),
-                    "tasks": _fetch_active_tasks(db, list_id),
-                    "changed_video_ids": _fetch_changed_video_ids(
-                        db, list_id, since_timestamp
-                    ),
+            # Advance to the newest row actually sent rather than the clock
+            if changed:
+                sent.update(changed)
+                state["watermark"] = max(state["watermark"], changed[-1][1])
+                window_start = state["watermark"] - CHANGE_LOOKBACK
+                state["sent"] = {
+                    video_id: updated_at
+                    for video_id, updated_at in sent.items()
+                    if updated_at >= window_start
                 }
+            return payload, len(changed) == changed_batch_size
+
+        async def send_changes():
+            more = True
+            while more:
+                payload, more = await event_loop.run_in_executor(
+                    sse_executor, fetch_payload
+                )
+                if payload is not None:
+                    yield encode_sse_data(payload)
 
         # Send initial data
-        payload = await event_loop.run_in_executor(
-            sse_executor, fetch_payload, last_change_check
-        )
-        yield {"data": json.dumps(payload, default=str)}
-        last_change_check = datetime.utcnow()
+        async for message in send_changes():
+            yield message
 
         async with hub.subscribe(Channel.list_videos(list_id)) as notification_queue:
             while True:
@@ -1083,13 +1231,10 @@ async def get_list_video_stats(list_id: int, request: Request):
                     await asyncio.wait_for(
                         notification_queue.get(), timeout=heartbeat_interval
                     )
-                    payload = await event_loop.run_in_executor(
-                        sse_executor, fetch_payload, last_change_check
-                    )
-                    yield {"data": json.dumps(payload, default=str)}
-                    last_change_check = datetime.utcnow()
+                    async for message in send_changes():
+                        yield message
                 except TimeoutError:
-                    yield {"comment": "heartbeat"}
+                    yield SSE_HEARTBEAT
 
     return EventSourceResponse(generate_sse_stream(), headers=sse_cors_headers(request))
 
@@ -16,6 +16,7 @@ Example:
 
 import json
 import os
+from contextlib import closing
 
 from fastapi import APIRouter, Depends, status
 from sqlalchemy.orm import Session
@@ -249,8 +250,8 @@ def test_notifier(
     test_config = _get_config_with_env(merged_config, notifier_id, schema)
 
     try:
-        notifier = notifier_class(test_config)
-        success, message = notifier.test_connection()
+        with closing(notifier_class(test_config)) as notifier:
+            success, message = notifier.test_connection()
 
         return {"success": success, "message": message}
 
@@ -282,12 +283,11 @@ def get_notifier_libraries(notifier_id: str, db: Session = Depends(get_read_db))
     config = _get_config_with_env(config, notifier_id, schema)
 
     try:
-        notifier = notifier_class(config)
-
-        # Check if notifier has get_libraries method
-        if hasattr(notifier, "get_libraries"):
-            libraries = notifier.get_libraries()
-            return {"libraries": libraries}
+        with closing(notifier_class(config)) as notifier:
+            # Check if notifier has get_libraries method
+            if hasattr(notifier, "get_libraries"):
+                libraries = notifier.get_libraries()
+                return {"libraries": libraries}
 
         return {"libraries": []}
 
@@ -3,6 +3,7 @@ Profiles routes.
 """
 
 from fastapi import APIRouter, Depends, status
+from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 
 from app.core.constants import (
@@ -141,8 +142,9 @@ def create_profile(payload: ProfileCreate, db: Session = Depends(get_db)):
 @router.get("", response_model=list[ProfileResponse])
 def list_profiles(db: Session = Depends(get_read_db)):
     """Get all profiles."""
-    profiles = db.query(Profile).all()
-    return [profile.to_dict() for profile in profiles]
+    # Rows come straight from the database in ProfileResponse's shape, so
+    # send them as-is rather than validating each through the response model
+    return JSONResponse([profile.to_dict() for profile in db.query(Profile)])
 
 
 @router.get("/{profile_id}", response_model=ProfileResponse)
@@ -152,7 +154,7 @@ def get_profile(profile_id: int, db: Session = Depends(get_read_db)):
     if not profile:
         raise NotFoundError("Profile", profile_id)
 
-    return profile.to_dict()
+    return JSONResponse(profile.to_dict())
 
 
 @router.put("/{profile_id}", response_model=ProfileResponse)
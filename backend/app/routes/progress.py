@@ -6,16 +6,26 @@ Streams real-time progress data for active downloads.
 
 import asyncio
 import json
+import time
 
 from fastapi import APIRouter, Request
 from sse_starlette.sse import EventSourceResponse
 
 from app.services import progress_service
 from app.sse_hub import Channel, hub
-from app.sse_stream import sse_cors_headers, wants_sse
+from app.sse_stream import (
+    SSE_HEARTBEAT,
+    sse_cors_headers,
+    sse_data_frame,
+    wants_sse,
+)
 
 router = APIRouter(prefix="/api/progress", tags=["Progress"])
 
+HEARTBEAT_SECONDS = 30
+IDLE_TIMEOUT_SECONDS = 300
+TIMEOUT_FRAME = sse_data_frame(json.dumps({"status": "timeout"}))
+
 
 @router.get("")
 async def get_progress(request: Request):
@@ -27,7 +37,7 @@ async def get_progress(request: Request):
     - Server-Sent Events (SSE) stream for real-time updates when Accept header
       includes 'text/event-stream'
 
-    The SSE stream uses push notifications from the progress service,
+    The SSE stream is driven by push notifications from the progress service,
     with deduplication to avoid sending unchanged data.
     """
     if not wants_sse(request):
@@ -37,43 +47,51 @@ async def get_progress(request: Request):
         """
         SSE stream for download progress updates.
 
-        Streams progress data whenever it changes. Uses JSON comparison
-        for deduplication. Terminates after ~5 minutes of inactivity
-        to free up connections.
+        Wakes on progress notifications rather than polling. The store version
+        skips serialisation when nothing has changed, and JSON comparison
+        drops updates that leave the payload identical. The heartbeat wake-up
+        also picks up entries expired by the TTL. Terminates after ~5 minutes
+        without a change to free up connections.
         """
+        previous_version: int | None = None
         previous_json: str | None = None
-        idle_counter = 0
-        max_idle_iterations = 600  # ~5 minutes at 0.5s intervals
-        queue_timeout_seconds = 0  # First iteration: instant response
+        last_change = time.monotonic()
 
         async with hub.subscribe(Channel.PROGRESS) as notification_queue:
+            # Send the current state straight away, then wait for pushes
+            notified = True
             while True:
-                try:
-                    await asyncio.wait_for(
-                        notification_queue.get(), timeout=queue_timeout_seconds
-                    )
-                except TimeoutError:
-                    pass
-                finally:
-                    queue_timeout_seconds = 0.5  # Subsequent iterations: 0.5s polling
+                if not notified:
+                    try:
+                        await asyncio.wait_for(
+                            notification_queue.get(), timeout=HEARTBEAT_SECONDS
+                        )
+                        notified = True
+                    except TimeoutError:
+                        pass
 
                 # Fetch current progress data
-                progress_data = progress_service.get_all()
-                current_json = json.dumps(progress_data, sort_keys=True)
+                version, progress_data = progress_service.snapshot()
+                current_json = previous_json
+                if version != previous_version:
+                    previous_version = version
+                    current_json = json.dumps(progress_data, sort_keys=True)
 
                 # Only send if data has changed
                 if current_json != previous_json:
-                    yield {"data": current_json}
+                    yield sse_data_frame(current_json)
                     previous_json = current_json
-                    idle_counter = 0
-                else:
-                    idle_counter += 1
+                    last_change = time.monotonic()
+                elif not notified:
+                    yield SSE_HEARTBEAT
 
                 # Terminate stream after extended inactivity
-                if idle_counter > max_idle_iterations:
-                    yield {"data": json.dumps({"status": "timeout"})}
+                if time.monotonic() - last_change > IDLE_TIMEOUT_SECONDS:
+                    yield TIMEOUT_FRAME
                     break
 
+                notified = False
+
     return EventSourceResponse(
         generate_progress_stream(), headers=sse_cors_headers(request)
     )
@@ -3,6 +3,7 @@
 from datetime import datetime
 
 from fastapi import APIRouter, Depends, status
+from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 
 from app.core.exceptions import NotFoundError, ValidationError
@@ -23,8 +24,9 @@ router = APIRouter(prefix="/api/schedules", tags=["Schedules"])
 @router.get("", response_model=list[ScheduleResponse])
 def list_schedules(db: Session = Depends(get_db)):
     """Get all download schedules."""
-    schedules = db.query(DownloadSchedule).order_by(DownloadSchedule.name).all()
-    return [s.to_dict() for s in schedules]
+    schedules = db.query(DownloadSchedule).order_by(DownloadSchedule.name)
+    # Trusted model output; bypass response_model validation
+    return JSONResponse([s.to_dict() for s in schedules])
 
 
 @router.get("/status", response_model=ScheduleStatusResponse)
@@ -61,7 +63,7 @@ def get_schedule(schedule_id: int, db: Session = Depends(get_db)):
     schedule = db.get(DownloadSchedule, schedule_id)
     if not schedule:
         raise NotFoundError("DownloadSchedule", schedule_id)
-    return schedule.to_dict()
+    return JSONResponse(schedule.to_dict())
 
 
 @router.put("/{schedule_id}", response_model=ScheduleResponse)
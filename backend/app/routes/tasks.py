@@ -2,18 +2,15 @@
 Tasks routes.
 """
 
-import asyncio
-import json
-
 from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import JSONResponse
 from sqlalchemy import case, func, literal_column
 from sqlalchemy.orm import Session, aliased
-from sse_starlette.sse import EventSourceResponse
 
 from app.core.exceptions import ConflictError, NotFoundError, ValidationError
 from app.core.helpers import calculate_total_pages
 from app.core.logging import get_logger
-from app.extensions import ReadSessionLocal, get_db, sse_executor
+from app.extensions import ReadSessionLocal, get_db
 from app.models.task import Task, TaskStatus, TaskType
 from app.models.video import Video
 from app.models.video_list import VideoList
@@ -24,8 +21,8 @@ from app.schemas.tasks import (
     TasksPaginatedResponse,
     TaskStatsResponse,
 )
-from app.sse_hub import Channel, broadcast, hub
-from app.sse_stream import sse_cors_headers, sse_response, wants_sse
+from app.sse_hub import Channel, broadcast
+from app.sse_stream import sse_response, wants_sse
 from app.task_queue import get_worker
 from app.tasks import enqueue_task, schedule_downloads, schedule_syncs
 
@@ -213,7 +210,10 @@ async def list_tasks(
 ):
     """List paginated tasks or stream updates via SSE."""
     if not wants_sse(request):
-        return _fetch_tasks_paginated(task_type, status_filter, search, page, page_size)
+        # Rows come straight from the tasks table; no need to re-validate them
+        return JSONResponse(
+            _fetch_tasks_paginated(task_type, status_filter, search, page, page_size)
+        )
 
     return sse_response(
         request,
@@ -221,58 +221,33 @@ async def list_tasks(
         lambda: _fetch_tasks_paginated(
             task_type, status_filter, search, page, page_size
         ),
+        cache_key=(task_type, status_filter, search, page, page_size),
     )
 
 
+def _fetch_task_stats() -> dict:
+    """Fetch queue statistics, worker state and schedule status."""
+    from app.models.download_schedule import DownloadSchedule
+
+    with ReadSessionLocal() as db:
+        stats = _fetch_task_counts(db)
+        worker = get_worker()
+        if worker:
+            stats["worker"] = worker.get_stats()
+        # Check if downloads are paused due to schedule
+        stats["schedule_paused"] = not DownloadSchedule.is_download_allowed(db)
+        return stats
+
+
 @router.get("/stats", response_model=TaskStatsResponse)
 async def task_stats(request: Request):
     """Return queue statistics or stream via SSE."""
     if not wants_sse(request):
-        with ReadSessionLocal() as db:
-            stats = _fetch_task_counts(db)
-            worker = get_worker()
-            if worker:
-                stats["worker"] = worker.get_stats()
-            # Check if downloads are paused due to schedule
-            from app.models.download_schedule import DownloadSchedule
-
-            stats["schedule_paused"] = not DownloadSchedule.is_download_allowed(db)
-            return stats
-
-    async def stream():
-        """SSE stream for task statistics updates."""
-        event_loop = asyncio.get_running_loop()
-        heartbeat_interval = 30
-
-        def fetch_stats():
-            with ReadSessionLocal() as db:
-                stats = _fetch_task_counts(db)
-                worker = get_worker()
-                if worker:
-                    stats["worker"] = worker.get_stats()
-                # Check if downloads are paused due to schedule
-                from app.models.download_schedule import DownloadSchedule
-
-                stats["schedule_paused"] = not DownloadSchedule.is_download_allowed(db)
-                return stats
-
-        # Send initial data immediately
-        stats = await event_loop.run_in_executor(sse_executor, fetch_stats)
-        yield {"data": json.dumps(stats, default=str)}
-
-        async with hub.subscribe(Channel.TASKS_STATS) as notification_queue:
-            while True:
-                try:
-                    await asyncio.wait_for(
-                        notification_queue.get(), timeout=heartbeat_interval
-                    )
-                    # Received notification - fetch and send fresh data
-                    stats = await event_loop.run_in_executor(sse_executor, fetch_stats)
-                    yield {"data": json.dumps(stats, default=str)}
-                except TimeoutError:
-                    yield {"comment": "heartbeat"}
-
-    return EventSourceResponse(stream(), headers=sse_cors_headers(request))
+        return _fetch_task_stats()
+
+    # Not shared between streams: schedule_paused depends on the current time,
+    # which no broadcast tracks, so each connection fetches its own stats
+    return sse_response(request, Channel.TASKS_STATS, _fetch_task_stats)
 
 
 @router.post("/sync/list/{list_id}", status_code=202, response_model=TaskResponse)
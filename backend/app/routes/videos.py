@@ -5,6 +5,7 @@ Videos routes.
 import asyncio
 
 from fastapi import APIRouter, Depends, Query
+from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 
 from app.core.exceptions import ConflictError, NotFoundError, ValidationError
@@ -23,6 +24,13 @@ logger = get_logger("routes.videos")
 router = APIRouter(prefix="/api/videos", tags=["Videos"])
 
 
+def _video_with_list(video: Video) -> dict:
+    """Serialise a video along with its parent list."""
+    result = video.to_dict()
+    result["list"] = video.video_list.to_dict() if video.video_list else None
+    return result
+
+
 @router.get("/{video_id}", response_model=VideoWithListResponse)
 async def get_video(video_id: int):
     """Get a single video by ID."""
@@ -30,11 +38,7 @@ async def get_video(video_id: int):
     def fetch():
         with ReadSessionLocal() as db:
             v = db.get(Video, video_id)
-            if not v:
-                return None
-            result = v.to_dict()
-            result["list"] = v.video_list.to_dict() if v.video_list else None
-            return result
+            return _video_with_list(v) if v else None
 
     result = await asyncio.get_event_loop().run_in_executor(sse_executor, fetch)
     if result is None:
@@ -93,9 +97,7 @@ def toggle_blacklist(video_id: int, db: Session = Depends(get_db)):
     # Notify SSE subscribers
     broadcast(Channel.list_videos(video.list_id))
 
-    result = video.to_dict()
-    result["list"] = video.video_list.to_dict() if video.video_list else None
-    return result
+    return _video_with_list(video)
 
 
 def _fetch_video_tasks(video_id: int, page: int, page_size: int) -> dict:
@@ -134,4 +136,4 @@ async def get_video_tasks(
     page_size: int = Query(10, ge=1, le=100),
 ):
     """Get paginated tasks for a specific video."""
-    return _fetch_video_tasks(video_id, page, page_size)
+    return JSONResponse(_fetch_video_tasks(video_id, page, page_size))
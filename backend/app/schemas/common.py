@@ -1,11 +1,13 @@
 """Common schemas."""
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class MessageResponse(BaseModel):
     """Generic message response."""
 
+    model_config = ConfigDict(defer_build=True)
+
     message: str
 
 
@@ -2,18 +2,17 @@
 
 from typing import Any
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class HistoryResponse(BaseModel):
     """History entry response."""
 
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     action: str
     entity_type: str
     entity_id: int | None = None
-    details: dict[str, Any] = {}
+    details: dict[str, Any] = Field(default_factory=dict)
     created_at: str
-
-    class Config:
-        from_attributes = True
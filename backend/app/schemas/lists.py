@@ -56,8 +56,10 @@ class BulkListCreate(BaseModel):
 class BulkListResponse(BaseModel):
     """Bulk list creation response."""
 
-    created: list["ListResponse"] = []
-    errors: list[dict] = []
+    model_config = ConfigDict(defer_build=True)
+
+    created: list["ListResponse"] = Field(default_factory=list)
+    errors: list[dict] = Field(default_factory=list)
 
 
 class ListUpdate(BaseModel):
@@ -87,7 +89,7 @@ class ListUpdate(BaseModel):
 class ListResponse(BaseModel):
     """List response."""
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
     id: int
     name: str
@@ -108,7 +110,7 @@ class ListResponse(BaseModel):
     next_sync_at: str | None = None
     description: str | None = None
     thumbnail: str | None = None
-    tags: list[str] = []
+    tags: list[str] = Field(default_factory=list)
     created_at: str
     updated_at: str
 
@@ -130,7 +132,7 @@ class ListVideoStatsResponse(BaseModel):
 
     stats: VideoStatsResponse
     tasks: ActiveTasksResponse
-    changed_video_ids: list[int] = []
+    changed_video_ids: list[int] = Field(default_factory=list)
 
 
 class VideoSummary(BaseModel):
@@ -146,7 +148,8 @@ class VideoSummary(BaseModel):
     downloaded: bool = False
     blacklisted: bool = False
     error_message: str | None = None
-    labels: dict = {}
+    labels: dict = Field(default_factory=dict)
+    filesize: int | None = None
 
 
 class VideosPaginatedResponse(BaseModel):
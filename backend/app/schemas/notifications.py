@@ -4,13 +4,14 @@ Notification schemas.
 
 from __future__ import annotations
 
-from enum import Enum
+from dataclasses import dataclass, field
+from enum import StrEnum
 from typing import Any
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
-class Event(str, Enum):
+class Event(StrEnum):
     """Notification event types."""
 
     DOWNLOAD_COMPLETED = "download_completed"
@@ -18,7 +19,8 @@ class Event(str, Enum):
     SYNC_COMPLETED = "sync_completed"
 
 
-class EventConfig(BaseModel):
+@dataclass(frozen=True, slots=True)
+class EventConfig:
     """Definition for a supported event."""
 
     event: Event
@@ -65,7 +67,8 @@ NOTIFY_SYNC = EventConfig(
 )
 
 
-class ConfigField(BaseModel):
+@dataclass(frozen=True, slots=True)
+class ConfigField:
     """Definition for a configuration field."""
 
     type: str  # "string", "password", "select"
@@ -75,7 +78,10 @@ class ConfigField(BaseModel):
     help: str = ""
     dynamic_options: str | None = None
 
-    def to_dict(self) -> dict[str, Any]:
+    # Fields are fixed once a notifier declares them, so serialise once
+    _as_dict: dict[str, Any] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
         d = {
             "type": self.type,
             "label": self.label,
@@ -86,7 +92,10 @@ class ConfigField(BaseModel):
             d["help"] = self.help
         if self.dynamic_options:
             d["dynamic_options"] = self.dynamic_options
-        return d
+        object.__setattr__(self, "_as_dict", d)
+
+    def to_dict(self) -> dict[str, Any]:
+        return self._as_dict
 
 
 class NotifierConfigUpdate(BaseModel):
@@ -94,7 +103,7 @@ class NotifierConfigUpdate(BaseModel):
 
     enabled: bool
     config: dict
-    events: dict[str, bool] = {}
+    events: dict[str, bool] = Field(default_factory=dict)
 
 
 class NotifierTestRequest(BaseModel):
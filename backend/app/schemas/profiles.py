@@ -1,10 +1,32 @@
 """Profile schemas."""
 
-from pydantic import BaseModel, ConfigDict, Field
+from typing import Annotated
+
+from pydantic import BaseModel, BeforeValidator, ConfigDict, Field
 
 from app.core.constants import DEFAULT_OUTPUT_TEMPLATE
 
 
+def _join_languages(value):
+    """
+    Normalise subtitle languages to a comma-separated string.
+
+    Accepts a list of codes or a comma-separated string, dropping blanks and
+    surrounding whitespace so the stored value splits cleanly at download time.
+    """
+    if value is None:
+        return value
+    if isinstance(value, str):
+        value = value.split(",")
+    if isinstance(value, list):
+        codes = (str(code).strip() for code in value)
+        return ",".join(code for code in codes if code)
+    return value
+
+
+LanguageList = Annotated[str, BeforeValidator(_join_languages)]
+
+
 class ProfileCreate(BaseModel):
     """Profile creation request."""
 
@@ -22,8 +44,8 @@ class ProfileCreate(BaseModel):
     auto_generated_subtitles: bool = Field(
         False, description="Include auto-generated subtitles"
     )
-    subtitle_languages: str = Field(
-        "en", description="Subtitle languages (comma-separated)"
+    subtitle_languages: LanguageList = Field(
+        "en", description="Subtitle languages (comma-separated or a list)"
     )
     audio_track_language: str | None = Field(
         "en", description="Preferred audio track language"
@@ -73,8 +95,8 @@ class ProfileUpdate(BaseModel):
     auto_generated_subtitles: bool | None = Field(
         None, description="Include auto-generated subtitles"
     )
-    subtitle_languages: str | None = Field(
-        None, description="Subtitle languages (comma-separated)"
+    subtitle_languages: LanguageList | None = Field(
+        None, description="Subtitle languages (comma-separated or a list)"
     )
     audio_track_language: str | None = Field(
         None, description="Preferred audio track language"
@@ -113,7 +135,7 @@ class ProfileUpdate(BaseModel):
 class ProfileResponse(BaseModel):
     """Profile response matching Profile.to_dict() output."""
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
     id: int
     name: str
@@ -121,7 +143,7 @@ class ProfileResponse(BaseModel):
     embed_thumbnail: bool = True
     include_shorts: bool = True
     include_live: bool = True
-    extra_args: dict = {}
+    extra_args: dict = Field(default_factory=dict)
     download_subtitles: bool = False
     embed_subtitles: bool = False
     auto_generated_subtitles: bool = False
@@ -129,7 +151,7 @@ class ProfileResponse(BaseModel):
     audio_track_language: str | None = "en"
     output_template: str = DEFAULT_OUTPUT_TEMPLATE
     sponsorblock_behaviour: str = "disabled"
-    sponsorblock_categories: list[str] = []
+    sponsorblock_categories: list[str] = Field(default_factory=list)
     output_format: str | None
     preferred_resolution: int | None
     preferred_video_codec: str | None
@@ -143,6 +165,8 @@ class ProfileResponse(BaseModel):
 class ProfileDefaults(BaseModel):
     """Default profile settings."""
 
+    model_config = ConfigDict(defer_build=True)
+
     output_template: str
     embed_metadata: bool
     embed_thumbnail: bool
@@ -167,6 +191,8 @@ class ProfileDefaults(BaseModel):
 class SponsorBlockOptions(BaseModel):
     """SponsorBlock configuration options."""
 
+    model_config = ConfigDict(defer_build=True)
+
     behaviours: list[str]
     categories: list[str]
     category_labels: dict[str, str]
@@ -175,6 +201,8 @@ class SponsorBlockOptions(BaseModel):
 class ResolutionOption(BaseModel):
     """Resolution option with label and value."""
 
+    model_config = ConfigDict(defer_build=True)
+
     label: str
     value: int
 
@@ -182,6 +210,8 @@ class ResolutionOption(BaseModel):
 class CodecOption(BaseModel):
     """Codec option with label and value."""
 
+    model_config = ConfigDict(defer_build=True)
+
     label: str
     value: str
 
@@ -189,6 +219,8 @@ class CodecOption(BaseModel):
 class ProfileOptionsResponse(BaseModel):
     """Profile options and defaults."""
 
+    model_config = ConfigDict(defer_build=True)
+
     defaults: ProfileDefaults
     sponsorblock: SponsorBlockOptions
     resolutions: list[ResolutionOption]
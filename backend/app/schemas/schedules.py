@@ -1,6 +1,23 @@
 """Download schedule schemas."""
 
-from pydantic import BaseModel, field_validator
+import re
+
+from pydantic import BaseModel, ConfigDict, field_validator
+
+# HH:MM between 00:00 and 23:59; single-digit parts are accepted as before
+_TIME_PATTERN = re.compile(r"(?:[01]?\d|2[0-3]):[0-5]?\d")
+_TIME_ERROR = "Time must be in HH:MM format (00:00 - 23:59)"
+
+_VALID_DAYS = frozenset(("mon", "tue", "wed", "thu", "fri", "sat", "sun"))
+
+
+def _normalise_days(days: list[str]) -> list[str]:
+    """Lowercase day names, rejecting any that are not recognised."""
+    lowered = [day.lower() for day in days]
+    for day, original in zip(lowered, days, strict=True):
+        if day not in _VALID_DAYS:
+            raise ValueError(f"Invalid day: {original}")
+    return lowered
 
 
 class ScheduleCreate(BaseModel):
@@ -15,24 +32,13 @@ class ScheduleCreate(BaseModel):
     @field_validator("days_of_week")
     @classmethod
     def validate_days(cls, v: list[str]) -> list[str]:
-        valid_days = {"mon", "tue", "wed", "thu", "fri", "sat", "sun"}
-        for day in v:
-            if day.lower() not in valid_days:
-                raise ValueError(f"Invalid day: {day}")
-        return [d.lower() for d in v]
+        return _normalise_days(v)
 
     @field_validator("start_time", "end_time")
     @classmethod
     def validate_time(cls, v: str) -> str:
-        try:
-            parts = v.split(":")
-            if len(parts) != 2:
-                raise ValueError()
-            hour, minute = int(parts[0]), int(parts[1])
-            if not (0 <= hour <= 23 and 0 <= minute <= 59):
-                raise ValueError()
-        except (ValueError, IndexError) as ex:
-            raise ValueError("Time must be in HH:MM format (00:00 - 23:59)") from ex
+        if not _TIME_PATTERN.fullmatch(v):
+            raise ValueError(_TIME_ERROR)
         return v
 
 
@@ -48,34 +54,21 @@ class ScheduleUpdate(BaseModel):
     @field_validator("days_of_week")
     @classmethod
     def validate_days(cls, v: list[str] | None) -> list[str] | None:
-        if v is None:
-            return v
-        valid_days = {"mon", "tue", "wed", "thu", "fri", "sat", "sun"}
-        for day in v:
-            if day.lower() not in valid_days:
-                raise ValueError(f"Invalid day: {day}")
-        return [d.lower() for d in v]
+        return v if v is None else _normalise_days(v)
 
     @field_validator("start_time", "end_time")
     @classmethod
     def validate_time(cls, v: str | None) -> str | None:
-        if v is None:
-            return v
-        try:
-            parts = v.split(":")
-            if len(parts) != 2:
-                raise ValueError()
-            hour, minute = int(parts[0]), int(parts[1])
-            if not (0 <= hour <= 23 and 0 <= minute <= 59):
-                raise ValueError()
-        except (ValueError, IndexError):
-            raise ValueError("Time must be in HH:MM format (00:00 - 23:59)") from None
+        if v is not None and not _TIME_PATTERN.fullmatch(v):
+            raise ValueError(_TIME_ERROR)
         return v
 
 
 class ScheduleResponse(BaseModel):
     """Schema for schedule response."""
 
+    model_config = ConfigDict(frozen=True)
+
     id: int
     name: str
     enabled: bool
@@ -89,5 +82,7 @@ class ScheduleResponse(BaseModel):
 class ScheduleStatusResponse(BaseModel):
     """Schema for schedule status check."""
 
+    model_config = ConfigDict(frozen=True)
+
     downloads_allowed: bool
     active_schedules: int
@@ -1,11 +1,13 @@
 """Settings schemas."""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class DataRetentionResponse(BaseModel):
     """Data retention settings response."""
 
+    model_config = ConfigDict(frozen=True)
+
     retention_days: int = Field(
         description="Number of days to retain data (0 = disabled)"
     )
@@ -24,6 +26,8 @@ class DataRetentionUpdate(BaseModel):
 class VacuumResponse(BaseModel):
     """Response from database vacuum operation."""
 
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
     success: bool = Field(description="Whether the vacuum operation succeeded")
     message: str = Field(description="Status message")
     size_before: int | None = Field(
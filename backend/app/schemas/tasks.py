@@ -6,7 +6,7 @@ from pydantic import BaseModel, ConfigDict, Field
 class TaskResponse(BaseModel):
     """Task response."""
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
     id: int
     task_type: str
@@ -25,7 +25,7 @@ class TaskResponse(BaseModel):
 class TaskLogResponse(BaseModel):
     """Task log response."""
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True, defer_build=True)
 
     id: int
     attempt: int
@@ -37,6 +37,8 @@ class TaskLogResponse(BaseModel):
 class WorkerStats(BaseModel):
     """Worker statistics."""
 
+    model_config = ConfigDict(frozen=True)
+
     running_sync: int
     running_download: int
     max_sync_workers: int
@@ -49,6 +51,8 @@ class WorkerStats(BaseModel):
 class TaskStatsResponse(BaseModel):
     """Task statistics response."""
 
+    model_config = ConfigDict(frozen=True)
+
     pending_sync: int
     pending_download: int
     running_sync: int
@@ -60,13 +64,17 @@ class TaskStatsResponse(BaseModel):
 class TaskStatusList(BaseModel):
     """List of entity IDs by status."""
 
-    pending: list[int] = []
-    running: list[int] = []
+    model_config = ConfigDict(frozen=True)
+
+    pending: list[int] = Field(default_factory=list)
+    running: list[int] = Field(default_factory=list)
 
 
 class ActiveTasksResponse(BaseModel):
     """Active tasks response."""
 
+    model_config = ConfigDict(frozen=True)
+
     sync: TaskStatusList
     download: TaskStatusList
 
@@ -74,6 +82,8 @@ class ActiveTasksResponse(BaseModel):
 class TasksPaginatedResponse(BaseModel):
     """Paginated tasks response."""
 
+    model_config = ConfigDict(frozen=True)
+
     tasks: list[TaskResponse]
     total: int
     page: int
@@ -84,19 +94,25 @@ class TasksPaginatedResponse(BaseModel):
 class BulkSyncRequest(BaseModel):
     """Bulk sync request."""
 
-    list_ids: list[int] = Field(..., min_length=1, description="List IDs to sync")
+    model_config = ConfigDict(defer_build=True)
+
+    list_ids: list[int] = Field(min_length=1)
 
 
 class BulkDownloadRequest(BaseModel):
     """Bulk download request."""
 
-    video_ids: list[int] = Field(..., min_length=1, description="Video IDs to download")
+    model_config = ConfigDict(defer_build=True)
+
+    video_ids: list[int] = Field(min_length=1)
 
 
 class BulkTaskIdsRequest(BaseModel):
     """Bulk task IDs request."""
 
-    task_ids: list[int] = Field(..., min_length=1, description="Task IDs to operate on")
+    model_config = ConfigDict(defer_build=True)
+
+    task_ids: list[int] = Field(min_length=1)
 
 
 class BulkResultResponse(BaseModel):
@@ -109,5 +125,7 @@ class BulkResultResponse(BaseModel):
 class BulkTaskResultResponse(BaseModel):
     """Bulk task operation result."""
 
+    model_config = ConfigDict(defer_build=True)
+
     affected: int
     skipped: int
@@ -1,12 +1,12 @@
 """Video schemas."""
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class VideoResponse(BaseModel):
     """Video response."""
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
     id: int
     video_id: str
@@ -19,7 +19,7 @@ class VideoResponse(BaseModel):
     extractor: str | None = None
     media_type: str = "video"
     filesize: int | None = None
-    labels: dict = {}
+    labels: dict = Field(default_factory=dict)
     list_id: int
     downloaded: bool = False
     blacklisted: bool = False
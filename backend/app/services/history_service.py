@@ -2,13 +2,41 @@
 History service for audit logging.
 """
 
+import logging
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.core.logging import get_logger
 from app.models import History, HistoryAction
+from app.sse_hub import Channel, broadcast
 
 logger = get_logger("history")
 
+# Newest first, served by ix_history_created_at; filters are added per call
+_HISTORY_STMT = select(History).order_by(History.created_at.desc())
+
+
+class HistoryBatch:
+    """History entries queued by HistoryService.batch."""
+
+    def __init__(self) -> None:
+        self.entries: list[History] = []
+
+    def log(
+        self,
+        action: HistoryAction,
+        entity_type: str,
+        entity_id: int | None = None,
+        details: dict | None = None,
+    ) -> History:
+        """Queue an entry; arguments match HistoryService.log."""
+        entry = HistoryService._build(action, entity_type, entity_id, details)
+        self.entries.append(entry)
+        return entry
+
 
 class HistoryService:
     """Service for logging actions to the history table."""
@@ -36,27 +64,66 @@ class HistoryService:
         Returns:
             The created History entry.
         """
-        entry = History(
-            action=action.value,
-            entity_type=entity_type,
-            entity_id=entity_id,
-            details=details or {},
-        )
+        entry = HistoryService._build(action, entity_type, entity_id, details)
         db.add(entry)
         if commit:
             db.commit()
 
-        from app.sse_hub import Channel, broadcast
-
         broadcast(Channel.HISTORY)
+        return entry
+
+    @staticmethod
+    @contextmanager
+    def batch(db: Session) -> Iterator["HistoryBatch"]:
+        """
+        Collect history entries and write them with a single commit.
+
+        Anything else pending on the session is committed alongside the
+        entries, and subscribers are notified once. If the block raises,
+        the session is rolled back, so neither the entries nor the other
+        pending changes are written.
+
+        Args:
+            db: Database session.
 
-        logger.debug(
-            "History: %s %s/%s %s",
-            action.value,
-            entity_type,
-            entity_id,
-            details,
+        Yields:
+            A HistoryBatch whose log() queues an entry.
+        """
+        pending = HistoryBatch()
+        try:
+            yield pending
+        except BaseException:
+            db.rollback()
+            raise
+
+        db.add_all(pending.entries)
+        db.commit()
+        if pending.entries:
+            broadcast(Channel.HISTORY)
+
+    @staticmethod
+    def _build(
+        action: HistoryAction,
+        entity_type: str,
+        entity_id: int | None,
+        details: dict | None,
+    ) -> History:
+        """Create an unsaved History entry."""
+        # Checked per call so a runtime log-level change is still honoured
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "History: %s %s/%s %s",
+                action.value,
+                entity_type,
+                entity_id,
+                details,
+            )
+        entry = History(
+            action=action.value, entity_type=entity_type, entity_id=entity_id
         )
+        # Without details the column's own default fills in {} at insert
+        if details is not None:
+            entry.details = details
         return entry
 
     @staticmethod
@@ -80,14 +147,14 @@ class HistoryService:
         Returns:
             List of History entries.
         """
-        query = db.query(History).order_by(History.created_at.desc())
+        stmt = _HISTORY_STMT
 
         if entity_type:
-            query = query.filter_by(entity_type=entity_type)
+            stmt = stmt.where(History.entity_type == entity_type)
         if action:
-            query = query.filter_by(action=action)
+            stmt = stmt.where(History.action == action)
 
-        query = query.offset(offset)
+        stmt = stmt.offset(offset)
         if limit:
-            query = query.limit(limit)
-        return query.all()
+            stmt = stmt.limit(limit)
+        return list(db.execute(stmt).scalars())
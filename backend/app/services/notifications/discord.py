@@ -47,6 +47,11 @@ class DiscordNotifier(HTTPNotifier):
         self.username = config.get("username", "") or "Corvin"
         self.avatar_url = config.get("avatar_url", "")
 
+        # Sender fields are the same for every message, so build them once
+        self._sender: dict[str, Any] = {"username": self.username}
+        if self.avatar_url:
+            self._sender["avatar_url"] = self.avatar_url
+
     def on_download_completed(self, data: dict[str, Any]) -> bool:
         title = data.get("title", "Unknown")
         list_name = data.get("list_name", "Unknown")
@@ -96,14 +101,7 @@ class DiscordNotifier(HTTPNotifier):
         if footer:
             embed["footer"] = {"text": footer}
 
-        payload: dict[str, Any] = {
-            "username": self.username,
-            "embeds": [embed],
-        }
-
-        if self.avatar_url:
-            payload["avatar_url"] = self.avatar_url
-
+        payload = {**self._sender, "embeds": [embed]}
         return self._safe_request("post", self.webhook_url, json=payload)
 
     def test_connection(self) -> tuple[bool, str]:
@@ -111,8 +109,8 @@ class DiscordNotifier(HTTPNotifier):
             return False, "Webhook URL is required"
 
         try:
-            payload: dict[str, Any] = {
-                "username": self.username,
+            payload = {
+                **self._sender,
                 "embeds": [
                     {
                         "title": "Test from Corvin",
@@ -121,10 +119,6 @@ class DiscordNotifier(HTTPNotifier):
                     }
                 ],
             }
-
-            if self.avatar_url:
-                payload["avatar_url"] = self.avatar_url
-
             resp = self._post(self.webhook_url, json=payload)
             resp.raise_for_status()
             return True, "Test message sent"
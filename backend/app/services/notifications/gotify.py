@@ -45,6 +45,8 @@ class GotifyNotifier(HTTPNotifier):
         self.server_url = config.get("server_url", "").rstrip("/")
         self.app_token = config.get("app_token", "")
         self.priority = int(config.get("priority") or 5)
+        self._headers = {"X-Gotify-Key": self.app_token}
+        self._message_url = f"{self.server_url}/message"
 
     def on_download_completed(self, data: dict[str, Any]) -> bool:
         title = data.get("title", "Unknown")
@@ -73,16 +75,15 @@ class GotifyNotifier(HTTPNotifier):
         if not self.server_url or not self.app_token:
             return False
 
-        url = f"{self.server_url}/message"
         return self._safe_request(
             "post",
-            url,
+            self._message_url,
             json={
                 "title": title,
                 "message": message,
                 "priority": self.priority,
             },
-            headers={"X-Gotify-Key": self.app_token},
+            headers=self._headers,
         )
 
     def test_connection(self) -> tuple[bool, str]:
@@ -92,15 +93,14 @@ class GotifyNotifier(HTTPNotifier):
             return False, "App token is required"
 
         try:
-            url = f"{self.server_url}/message"
             resp = self._post(
-                url,
+                self._message_url,
                 json={
                     "title": "Test from Corvin",
                     "message": "Gotify integration working!",
                     "priority": self.priority,
                 },
-                headers={"X-Gotify-Key": self.app_token},
+                headers=self._headers,
             )
             resp.raise_for_status()
             return True, "Test notification sent"
@@ -41,10 +41,9 @@ class JellyfinNotifier(HTTPNotifier):
         self.url = config.get("url", "").rstrip("/")
         self.api_key = config.get("api_key", "")
         self.library_id = config.get("library_id")
-
-    @property
-    def _headers(self) -> dict[str, str]:
-        return {
+        # Scans fire on every download, so resolve the endpoint once
+        self._refresh_url = urljoin(self.url, "/Library/Refresh")
+        self._headers = {
             "X-Emby-Token": self.api_key,
             "Content-Type": "application/json",
             "Accept": "application/json",
@@ -61,10 +60,7 @@ class JellyfinNotifier(HTTPNotifier):
             return False
 
         try:
-            resp = self._post(
-                urljoin(self.url, "/Library/Refresh"),
-                headers=self._headers,
-            )
+            resp = self._post(self._refresh_url, headers=self._headers)
             resp.raise_for_status()
             logger.info("Jellyfin scan triggered")
             return True
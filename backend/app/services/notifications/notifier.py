@@ -15,12 +15,15 @@ BaseNotifier requires you to define:
 When notify(Event.DOWNLOAD_COMPLETED, data) is called, it looks for
 a method called on_download_completed(data) and calls it if found.
 This means you just add on_<event_name> methods for events you handle.
+The lookup is done once per class, when the subclass is defined.
 
 When the notifier is registered, it will automagically show up in the UI as well.
 """
 
 from __future__ import annotations
 
+from collections.abc import Callable
+from functools import cached_property
 from typing import Any
 
 import requests
@@ -43,28 +46,51 @@ class BaseNotifier:
     config_schema: dict[str, ConfigField] = {}
     supported_events: list[EventConfig] = []
 
+    # on_<event> methods defined by the class, collected in __init_subclass__
+    _handlers: dict[Event, Callable[[BaseNotifier, dict[str, Any]], bool]] = {}
+    # Serialised config_schema and supported_events, also built per class
+    _schema_dict: dict[str, Any] = {}
+    _events_list: list[dict[str, Any]] = []
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._handlers = {}
+        for event in Event:
+            handler = getattr(cls, f"on_{event.value}", None)
+            if callable(handler):
+                cls._handlers[event] = handler
+
+        cls._schema_dict = {k: v.to_dict() for k, v in cls.config_schema.items()}
+        cls._events_list = [e.to_dict() for e in cls.supported_events]
+
     def __init__(self, config: dict[str, Any]) -> None:
         """Override to extract config values."""
         pass
 
     def notify(self, event: Event, data: dict[str, Any]) -> bool:
         """Dispatch to on_<event_name> handler if it exists."""
-        handler = getattr(self, f"on_{event.value}", None)
-        if callable(handler):
-            return handler(data)
+        handler = self._handlers.get(event)
+        if handler is not None:
+            return handler(self, data)
         return True
 
     def test_connection(self) -> tuple[bool, str]:
         """Test connectivity. Returns (success, message). Override in subclass."""
         return False, "Not implemented"
 
+    def close(self) -> None:
+        """Release any held resources. Override in subclass if needed."""
+        pass
+
     @classmethod
     def get_config_schema(cls) -> dict[str, Any]:
-        return {k: v.to_dict() for k, v in cls.config_schema.items()}
+        """Serialised config schema. Shared per class, so treat as read-only."""
+        return cls._schema_dict
 
     @classmethod
     def get_supported_events(cls) -> list[dict[str, Any]]:
-        return [e.to_dict() for e in cls.supported_events]
+        """Serialised supported events. Shared per class, so treat as read-only."""
+        return cls._events_list
 
 
 class HTTPNotifier(BaseNotifier):
@@ -72,15 +98,26 @@ class HTTPNotifier(BaseNotifier):
 
     timeout: int = 10
 
+    @cached_property
+    def _session(self) -> requests.Session:
+        """Session kept for the notifier's lifetime so connections are reused."""
+        return requests.Session()
+
+    def close(self) -> None:
+        """Close the HTTP session, if one was opened."""
+        session = self.__dict__.pop("_session", None)
+        if session is not None:
+            session.close()
+
     def _get(self, url: str, **kwargs: Any) -> requests.Response:
         """Make a GET request with default timeout."""
         kwargs.setdefault("timeout", self.timeout)
-        return requests.get(url, **kwargs)
+        return self._session.get(url, **kwargs)
 
     def _post(self, url: str, **kwargs: Any) -> requests.Response:
         """Make a POST request with default timeout."""
         kwargs.setdefault("timeout", self.timeout)
-        return requests.post(url, **kwargs)
+        return self._session.post(url, **kwargs)
 
     def _safe_request(
         self,
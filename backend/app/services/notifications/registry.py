@@ -22,10 +22,19 @@ class NotifierRegistry:
     """Registry of available notifier classes."""
 
     _notifiers: dict[str, type[BaseNotifier]] = {}
+    # Serialised catalog entry per notifier. Schemas and events are class
+    # constants, so each entry is built once at registration.
+    _catalog: dict[str, dict[str, Any]] = {}
 
     @classmethod
     def register(cls, notifier_cls: type[BaseNotifier]) -> None:
         cls._notifiers[notifier_cls.id] = notifier_cls
+        cls._catalog[notifier_cls.id] = {
+            "id": notifier_cls.id,
+            "name": notifier_cls.name,
+            "config_schema": notifier_cls.get_config_schema(),
+            "supported_events": notifier_cls.get_supported_events(),
+        }
         logger.debug("Registered notifier: %s", notifier_cls.id)
 
     @classmethod
@@ -34,12 +43,5 @@ class NotifierRegistry:
 
     @classmethod
     def all(cls) -> list[dict[str, Any]]:
-        return [
-            {
-                "id": n.id,
-                "name": n.name,
-                "config_schema": {k: v.to_dict() for k, v in n.config_schema.items()},
-                "supported_events": [e.to_dict() for e in n.supported_events],
-            }
-            for n in cls._notifiers.values()
-        ]
+        """Catalog entries for every notifier. Treat them as read-only."""
+        return list(cls._catalog.values())
@@ -7,16 +7,20 @@ new video found), call one of the convenience methods here.
 How it works:
     1. download_completed() calls send(Event.DOWNLOAD_COMPLETED, data)
     2. send() loops through all registered notifiers
-    3. For each notifier, checks DB settings to see if it's enabled
+    3. For each notifier, checks settings to see if it's enabled
     4. Also checks if this specific event is enabled for that notifier
-    5. Loads config from DB, merges with any environment variables
-    6. Creates notifier instance and calls notify(event, data)
+    5. Loads config from settings, merges with any environment variables
+    6. Creates notifier instance (reused while its config is unchanged)
+       and calls notify(event, data), in parallel when several are enabled
     7. Returns dict of {notifier_id: success} results
 
 Environment variables override database values for sensitive fields:
     NOTIFICATION_{NOTIFIER_ID}_{FIELD_NAME}
     e.g., NOTIFICATION_PLEX_TOKEN, NOTIFICATION_SLACK_WEBHOOK_URL
 
+The notification_* settings are read in one query and reused until any
+setting is written again, so a burst of events doesn't hit the DB per event.
+
 Uses @classmethod throughout because there's no instance state - it just
 reads from DB and dispatches. This matches the pattern in YtDlpService.
 """
@@ -25,14 +29,48 @@ from __future__ import annotations
 
 import json
 import os
-from typing import Any
+import threading
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from functools import cache
+from typing import TYPE_CHECKING, Any
 
 from app.core.logging import get_logger
 from app.schemas.notifications import Event
 from app.services.notifications.registry import NotifierRegistry
 
+if TYPE_CHECKING:
+    from app.services.notifications.notifier import BaseNotifier
+
 logger = get_logger("notifications")
 
+# Last notifier instance per notifier ID, with the config it was built from
+_instances: dict[str, tuple[tuple, BaseNotifier]] = {}
+
+# Runs notifier calls concurrently so one slow host doesn't hold up the rest.
+# Created on first use and shut down with the application.
+_pool: ThreadPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+# notification_* settings with the settings version they were read at
+_settings: tuple[int, dict[str, str]] | None = None
+
+
+@cache
+def _env_overrides(notifier_cls: type[BaseNotifier]) -> dict[str, str]:
+    """
+    Read a notifier's environment overrides once.
+
+    The environment is fixed for the life of the process, so the lookups
+    are done on first use rather than for every event.
+    """
+    nid = notifier_cls.id.upper()
+    overrides = {}
+    for field_name in notifier_cls.config_schema:
+        value = os.environ.get(f"NOTIFICATION_{nid}_{field_name.upper()}")
+        if value:
+            overrides[field_name] = value
+    return overrides
+
 
 class NotificationService:
     """Dispatches events to enabled notifiers."""
@@ -40,47 +78,146 @@ class NotificationService:
     @classmethod
     def send(cls, event: Event, data: dict[str, Any]) -> dict[str, bool]:
         """Send event to all enabled notifiers that handle it."""
-        from app.extensions import SessionLocal
         from app.models import Settings
 
         results = {}
-
-        with SessionLocal() as db:
-            for info in NotifierRegistry.all():
-                nid = info["id"]
-
-                # Check if notifier and event are enabled
-                if not Settings.get_bool(db, f"notification_{nid}_enabled", False):
-                    continue
-                if not Settings.get_bool(
-                    db, f"notification_{nid}_event_{event.value}", False
-                ):
+        ready: list[tuple[str, BaseNotifier]] = []
+        settings = cls._get_settings()
+
+        for info in NotifierRegistry.all():
+            nid = info["id"]
+
+            # Check if notifier and event are enabled
+            if not Settings.parse_bool(
+                settings.get(f"notification_{nid}_enabled", "false")
+            ):
+                continue
+            if not Settings.parse_bool(
+                settings.get(f"notification_{nid}_event_{event.value}", "false")
+            ):
+                continue
+
+            try:
+                notifier_cls = NotifierRegistry.get(nid)
+                if not notifier_cls:
                     continue
 
-                # Instantiate and dispatch
+                config_json = settings.get(f"notification_{nid}_config", "{}")
+                ready.append((nid, cls._get_notifier(notifier_cls, config_json)))
+            except Exception as e:
+                logger.error("Notifier %s failed: %s", nid, e)
+                results[nid] = False
+
+        # A single notifier runs inline; the pool only pays off with several
+        if len(ready) == 1:
+            nid, notifier = ready[0]
+            results[nid] = cls._dispatch(nid, notifier, event, data)
+        else:
+            futures: dict[str, Future[bool]] = {}
+            for nid, notifier in ready:
+                try:
+                    futures[nid] = cls._get_pool().submit(
+                        cls._dispatch, nid, notifier, event, data
+                    )
+                except RuntimeError:
+                    # The pool was shut down: the application is stopping
+                    results[nid] = False
+            for nid, future in futures.items():
                 try:
-                    notifier_cls = NotifierRegistry.get(nid)
-                    if not notifier_cls:
-                        continue
-
-                    config_json = Settings.get(db, f"notification_{nid}_config", "{}")
-                    config = json.loads(config_json) if config_json else {}
-
-                    # Merge with environment variables
-                    for field_name in notifier_cls.config_schema:
-                        env_name = f"NOTIFICATION_{nid.upper()}_{field_name.upper()}"
-                        env_value = os.environ.get(env_name)
-                        if env_value:
-                            config[field_name] = env_value
-
-                    notifier = notifier_cls(config)
-                    results[nid] = notifier.notify(event, data)
-                except Exception as e:
-                    logger.error("Notifier %s failed: %s", nid, e)
+                    results[nid] = future.result()
+                except CancelledError:
                     results[nid] = False
 
         return results
 
+    @classmethod
+    def _get_pool(cls) -> ThreadPoolExecutor:
+        """Return the notifier pool, creating it on first use."""
+        global _pool
+        with _pool_lock:
+            if _pool is None:
+                _pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="notify")
+            return _pool
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """
+        Stop the notifier pool without waiting for calls in progress.
+
+        Queued calls are cancelled. Called on application shutdown so a hung
+        notifier host doesn't hold it up; a later send starts a new pool.
+        """
+        global _pool
+        with _pool_lock:
+            pool, _pool = _pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _dispatch(
+        nid: str, notifier: BaseNotifier, event: Event, data: dict[str, Any]
+    ) -> bool:
+        """Call a notifier, logging and reporting failure instead of raising."""
+        try:
+            return notifier.notify(event, data)
+        except Exception as e:
+            logger.error("Notifier %s failed: %s", nid, e)
+            return False
+
+    @classmethod
+    def _get_settings(cls) -> dict[str, str]:
+        """
+        Return all notification_* settings, re-reading only after a write.
+
+        The version is read before querying, so a write that lands during
+        the query just causes another read on the next call.
+        """
+        global _settings
+        from app.extensions import SessionLocal
+        from app.models import Settings
+        from app.models.settings import settings_version
+
+        version = settings_version()
+        if _settings is not None and _settings[0] == version:
+            return _settings[1]
+
+        with SessionLocal() as db:
+            values = dict(
+                db.query(Settings.key, Settings.value).filter(
+                    Settings.key.startswith("notification_")
+                )
+            )
+        _settings = (version, values)
+        return values
+
+    @classmethod
+    def _get_notifier(
+        cls, notifier_cls: type[BaseNotifier], config_json: str | None
+    ) -> BaseNotifier:
+        """
+        Return a notifier for the stored config, reusing the last instance.
+
+        Instances are keyed on the raw config JSON, so the config is only
+        parsed and the notifier only rebuilt when it changes.
+        """
+        nid = notifier_cls.id
+        key = (notifier_cls, config_json)
+
+        cached = _instances.get(nid)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        config = json.loads(config_json) if config_json else {}
+
+        # Merge with environment variables
+        config.update(_env_overrides(notifier_cls))
+
+        # The replaced instance is left open: a send() already holding it may
+        # still be mid-request, and its session is released once it is dropped
+        notifier = notifier_cls(config)
+        _instances[nid] = (key, notifier)
+        return notifier
+
     @classmethod
     def download_completed(
         cls, title: str, path: str, list_name: str | None = None
@@ -5,21 +5,41 @@ Provides real-time download progress updates via SSE.
 Progress data is stored in memory and automatically cleaned up after TTL expires.
 """
 
+import re
 import threading
 import time
 from collections.abc import Callable
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 
 from app.sse_hub import Channel, broadcast
 
 _lock = threading.Lock()
 _store: dict[int, "ProgressEntry"] = {}
+# Last update time per video, kept in update order (oldest first) so the
+# TTL sweep can stop at the first fresh entry
 _timestamps: dict[int, float] = {}
+# Serialised form of each entry, dropped whenever that entry changes so
+# snapshots only rebuild the videos that moved
+_serialised: dict[int, dict] = {}
+# Bumped on every change to the store so readers can skip unchanged snapshots
+_version = 0
 
 TTL_SECONDS = 300
 
+# Number before the % sign. Anchoring on % skips the digits inside ANSI colour
+# codes, which yt-dlp adds to _percent_str when colour output is on.
+_PERCENT_PATTERN = re.compile(r"(\d+(?:\.\d+)?)%")
 
-@dataclass
+# Download ticks arrive many times a second per video; within this window
+# after a broadcast they don't trigger another
+BROADCAST_INTERVAL = 0.1
+
+# Monotonic time of the last progress broadcast
+_broadcast_lock = threading.Lock()
+_last_broadcast = float("-inf")
+
+
+@dataclass(slots=True)
 class ProgressEntry:
     """Represents the progress state for a single video download."""
 
@@ -33,38 +53,156 @@ class ProgressEntry:
     max_attempts: int | None = None
 
     def to_dict(self) -> dict:
-        return asdict(self)
-
+        # Flat fields only, so skip asdict()'s recursive copy
+        return {
+            "video_id": self.video_id,
+            "status": self.status,
+            "percent": self.percent,
+            "speed": self.speed,
+            "eta": self.eta,
+            "error": self.error,
+            "attempt": self.attempt,
+            "max_attempts": self.max_attempts,
+        }
+
+
+def _update(video_id: int, entry: ProgressEntry, coalesce: bool = False) -> None:
+    """
+    Replace the progress entry for a video and broadcast the update.
 
-def _update(video_id: int, entry: ProgressEntry) -> None:
-    """Replace the progress entry for a video and broadcast the update."""
+    Args:
+        video_id: The video the entry belongs to.
+        entry: The new progress state.
+        coalesce: Skip the broadcast if one went out within the last
+            BROADCAST_INTERVAL. Used for frequent download ticks; state
+            transitions broadcast straight away.
+    """
+    global _version
     with _lock:
         _store[video_id] = entry
-        _timestamps[video_id] = time.time()
+        _serialised.pop(video_id, None)
+        _touch(video_id)
+        _version += 1
+
+    if coalesce:
+        _broadcast_tick()
+    else:
+        flush()
+
+
+def _modify(video_id: int, coalesce: bool = False, **fields) -> None:
+    """
+    Update fields of a video's progress entry in place and broadcast.
+
+    Fields not passed keep their current values, so attempt info carries
+    over without being copied. An entry is created if none exists.
+
+    Args:
+        video_id: The video the entry belongs to.
+        coalesce: As for _update.
+        **fields: ProgressEntry fields to set.
+    """
+    global _version
+    with _lock:
+        entry = _store.get(video_id)
+        if entry is None:
+            entry = _store[video_id] = ProgressEntry(video_id=video_id)
+        for name, value in fields.items():
+            setattr(entry, name, value)
+        _serialised.pop(video_id, None)
+        _touch(video_id)
+        _version += 1
+
+    if coalesce:
+        _broadcast_tick()
+    else:
+        flush()
+
+
+def _touch(video_id: int) -> None:
+    """Record an update, moving the video to the end of the TTL order."""
+    _timestamps.pop(video_id, None)
+    _timestamps[video_id] = time.monotonic()
+
+
+def _broadcast_tick() -> None:
+    """Broadcast a download tick unless a broadcast went out very recently."""
+    global _last_broadcast
+    now = time.monotonic()
+    with _broadcast_lock:
+        if now - _last_broadcast < BROADCAST_INTERVAL:
+            return
+        _last_broadcast = now
+    broadcast(Channel.PROGRESS)
+
+
+def flush() -> None:
+    """
+    Broadcast progress straight away.
+
+    Used for state transitions. This also covers any ticks skipped since the
+    last broadcast, and restarts the tick interval.
+    """
+    global _last_broadcast
+    with _broadcast_lock:
+        _last_broadcast = time.monotonic()
     broadcast(Channel.PROGRESS)
 
 
 def _get(video_id: int) -> ProgressEntry | None:
     """Get the current progress entry for a video."""
-    with _lock:
-        return _store.get(video_id)
+    # A single dict lookup is atomic, so no lock is needed to read
+    return _store.get(video_id)
 
 
-def get_all() -> dict[int, dict]:
+def version() -> int:
+    """Get the current store version, which changes whenever progress does."""
+    return _version
+
+
+def snapshot() -> tuple[int, dict[int, dict]]:
     """
-    Get all active progress entries, cleaning up stale ones.
+    Get all active progress entries with the store version they reflect.
+
+    Stale entries are cleaned up first, which also counts as a change.
+    Only entries that changed since the last snapshot are serialised again;
+    the rest reuse their previous dicts, so treat them as read-only.
 
     Returns:
-        Dictionary mapping video_id to progress data.
+        Tuple of (version, dictionary mapping video_id to progress data).
     """
+    global _version
     with _lock:
-        now = time.time()
-        stale = [vid for vid, ts in _timestamps.items() if now - ts > TTL_SECONDS]
+        cutoff = time.monotonic() - TTL_SECONDS
+        stale = []
+        for vid, ts in _timestamps.items():
+            if ts >= cutoff:
+                break
+            stale.append(vid)
         for vid in stale:
             _store.pop(vid, None)
             _timestamps.pop(vid, None)
+            _serialised.pop(vid, None)
+        if stale:
+            _version += 1
 
-        return {vid: entry.to_dict() for vid, entry in _store.items()}
+        result = {}
+        for vid, entry in _store.items():
+            data = _serialised.get(vid)
+            if data is None:
+                data = _serialised[vid] = entry.to_dict()
+            result[vid] = data
+        return _version, result
+
+
+def get_all() -> dict[int, dict]:
+    """
+    Get all active progress entries, cleaning up stale ones.
+
+    Returns:
+        Dictionary mapping video_id to progress data.
+    """
+    return snapshot()[1]
 
 
 def clear(video_id: int) -> None:
@@ -106,6 +244,23 @@ def mark_retrying(video_id: int, attempt: int, max_attempts: int) -> None:
     )
 
 
+def _download_percent(data: dict) -> float:
+    """
+    Work out the download percentage from a yt-dlp progress update.
+
+    Uses the byte counts when yt-dlp reports them, which avoids parsing the
+    formatted _percent_str on every tick. Falls back to that string otherwise.
+    """
+    total = data.get("total_bytes") or data.get("total_bytes_estimate")
+    downloaded = data.get("downloaded_bytes")
+    if total and downloaded is not None:
+        # Estimates can undershoot, so clamp rather than report over 100%
+        return min(round(downloaded * 100.0 / total, 1), 100.0)
+
+    match = _PERCENT_PATTERN.search(data.get("_percent_str") or "")
+    return float(match.group(1)) if match else 0.0
+
+
 def create_hook(video_id: int) -> Callable[[dict], None]:
     """
     Create a yt-dlp progress hook for a video.
@@ -142,41 +297,27 @@ def create_hook(video_id: int) -> Callable[[dict], None]:
     def on_progress(data: dict) -> None:
         """Handle yt-dlp progress updates."""
         status = data.get("status")
-        current = _get(video_id)
-
-        # Preserve attempt info across updates
-        current_attempt = current.attempt if current else None
-        current_max = current.max_attempts if current else None
 
+        # Ticks update the existing entry, which keeps its attempt info
         if status == "downloading":
-            try:
-                percent = float(data.get("_percent_str", "0").strip().rstrip("%"))
-            except (ValueError, AttributeError):
-                percent = 0.0
-
-            _update(
+            _modify(
                 video_id,
-                ProgressEntry(
-                    video_id=video_id,
-                    status="downloading",
-                    percent=percent,
-                    speed=data.get("_speed_str"),
-                    eta=data.get("eta"),
-                    attempt=current_attempt,
-                    max_attempts=current_max,
-                ),
+                coalesce=True,
+                status="downloading",
+                percent=_download_percent(data),
+                speed=data.get("_speed_str"),
+                eta=data.get("eta"),
+                error=None,
             )
 
         elif status == "finished":
-            _update(
+            _modify(
                 video_id,
-                ProgressEntry(
-                    video_id=video_id,
-                    status="processing",
-                    percent=100.0,
-                    attempt=current_attempt,
-                    max_attempts=current_max,
-                ),
+                status="processing",
+                percent=100.0,
+                speed=None,
+                eta=None,
+                error=None,
             )
 
         elif status == "error":
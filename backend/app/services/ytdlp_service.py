@@ -7,7 +7,10 @@ and downloading individual videos based on the list profile configuration.
 
 from __future__ import annotations
 
+import os
 import threading
+import time
+import zlib
 from collections.abc import Callable
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
@@ -27,6 +30,21 @@ logger = get_logger("ytdlp")
 
 MAX_METADATA_WORKERS = 5  # Experimental amount
 
+# Per-thread YoutubeDL for metadata workers, so each worker sets one up once
+# rather than once per video
+_metadata_worker = threading.local()
+
+# Shared HTTP session for artwork, so images from the same CDN reuse the
+# connection instead of reconnecting for each file
+_session = requests.Session()
+
+# List metadata by URL with the monotonic time it was fetched. A new list is
+# synced straight after creation, and each sync re-fetches metadata while
+# any artwork is missing, so recent results are reused for a while.
+LIST_METADATA_TTL = 600
+_list_metadata_cache: dict[str, tuple[float, dict]] = {}
+_list_metadata_lock = threading.Lock()
+
 # Thumbnail ID to filename mapping for list artwork
 THUMBNAIL_ARTWORK_MAP = {
     "banner_uncropped": "fanart.jpg",
@@ -76,6 +94,10 @@ class YtDlpService:
         Raises:
             Exception: If metadata extraction fails.
         """
+        cached = _list_metadata_cache.get(url)
+        if cached is not None and time.monotonic() - cached[0] < LIST_METADATA_TTL:
+            return cached[1]
+
         logger.info("Extracting metadata from: %s", url)
 
         ydl_opts = {
@@ -99,7 +121,7 @@ class YtDlpService:
 
         thumbnails = info.get("thumbnails", [])
 
-        return {
+        metadata = {
             "name": info.get("title") or info.get("channel") or info.get("uploader"),
             "description": info.get("description"),
             "thumbnail": cls._get_best_thumbnail(thumbnails),
@@ -111,6 +133,21 @@ class YtDlpService:
             or info.get("id"),
         }
 
+        now = time.monotonic()
+        with _list_metadata_lock:
+            # Drop expired results so URLs that are never asked for again
+            # don't accumulate
+            expired = [
+                key
+                for key, (fetched, _) in _list_metadata_cache.items()
+                if now - fetched >= LIST_METADATA_TTL
+            ]
+            for key in expired:
+                del _list_metadata_cache[key]
+            _list_metadata_cache[url] = (now, metadata)
+
+        return metadata
+
     @classmethod
     def extract_videos(
         cls,
@@ -199,14 +236,20 @@ class YtDlpService:
         # If the list contains nested entry groups (items with an 'entries' key),
         # flatten and return all of their entries; otherwise, return the list as-is
         # If none of the items have an 'entries' key, return as-is
-        entries = info.get("entries", [])
-
-        if any(entry and "entries" in entry for entry in entries if entry):
-            flattened = []
-            for entry in entries:
-                if entry and "entries" in entry:
-                    flattened.extend(entry["entries"])
-            entries = flattened
+        # Sort nested groups from plain entries in one pass, rather than
+        # scanning the whole list for groups before walking it again
+        flat = []
+        nested = []
+        has_nested = False
+        for entry in info.get("entries") or []:
+            if not entry:
+                continue
+            if "entries" in entry:
+                has_nested = True
+                nested.extend(entry["entries"] or [])
+            elif not has_nested:
+                flat.append(entry)
+        entries = nested if has_nested else flat
 
         video_entries = []
         for entry in entries:
@@ -257,16 +300,29 @@ class YtDlpService:
             if thumb_id is not None and thumb_url:
                 thumb_lookup[str(thumb_id)] = thumb_url
 
+        jobs = {}
         for thumb_id, filename in THUMBNAIL_ARTWORK_MAP.items():
             url = thumb_lookup.get(thumb_id)
             if not url:
                 logger.info("Thumbnail ID '%s' not found in thumbnails", thumb_id)
                 results[filename] = False
                 continue
-
-            output_path = output_dir / filename
-            success = cls._download_image(url, output_path)
-            results[filename] = success
+            jobs[filename] = url
+
+        # Each image is a separate round-trip, so fetch them side by side
+        if len(jobs) > 1:
+            with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+                futures = {
+                    filename: executor.submit(
+                        cls._download_image, url, output_dir / filename
+                    )
+                    for filename, url in jobs.items()
+                }
+                for filename, future in futures.items():
+                    results[filename] = future.result()
+        else:
+            for filename, url in jobs.items():
+                results[filename] = cls._download_image(url, output_dir / filename)
 
         return results
 
@@ -293,9 +349,15 @@ class YtDlpService:
         artwork_files = ["fanart.jpg", "poster.jpg", "banner.jpg"]
         nfo_file = "tvshow.nfo"
 
-        # Check what's missing
-        missing_artwork = [f for f in artwork_files if not (artwork_dir / f).exists()]
-        missing_nfo = not (artwork_dir / nfo_file).exists()
+        # Check what's missing with one directory listing rather than a stat
+        # per file, as every sync runs this for its list
+        try:
+            with os.scandir(artwork_dir) as it:
+                existing = {entry.name for entry in it}
+        except FileNotFoundError:
+            existing = set()
+        missing_artwork = [f for f in artwork_files if f not in existing]
+        missing_nfo = nfo_file not in existing
 
         if not missing_artwork and not missing_nfo:
             return  # Everything exists
@@ -448,8 +510,10 @@ class YtDlpService:
             if video.video_list:
                 ET.SubElement(root, "showtitle").text = video.video_list.name
 
+            # hash() of a str is salted per process, so it gave the same video
+            # a different episode number after every restart
             ET.SubElement(root, "episode").text = str(
-                abs(hash(video.video_id)) % 1000000
+                zlib.crc32(video.video_id.encode()) % 1000000
             )
 
             unique_id = ET.SubElement(root, "uniqueid", type=extractor, default="true")
@@ -472,7 +536,7 @@ class YtDlpService:
         try:
             output_path.parent.mkdir(parents=True, exist_ok=True)
 
-            response = requests.get(url, timeout=30)
+            response = _session.get(url, timeout=30)
             response.raise_for_status()
 
             with open(output_path, "wb") as f:
@@ -505,8 +569,18 @@ class YtDlpService:
         from_date_str = from_date.strftime("%Y%m%d") if from_date else None
         stop_event = threading.Event()
         results = []
-
-        with ThreadPoolExecutor(max_workers=MAX_METADATA_WORKERS) as executor:
+        downloaders: list[yt_dlp.YoutubeDL] = []
+        downloaders_lock = threading.Lock()
+
+        def open_worker_downloader() -> None:
+            ydl = yt_dlp.YoutubeDL({**_METADATA_OPTS})
+            _metadata_worker.ydl = ydl
+            with downloaders_lock:
+                downloaders.append(ydl)
+
+        with ThreadPoolExecutor(
+            max_workers=MAX_METADATA_WORKERS, initializer=open_worker_downloader
+        ) as executor:
             futures = {
                 executor.submit(
                     cls._fetch_single_video, url, from_date_str, stop_event
@@ -525,6 +599,9 @@ class YtDlpService:
                     url = futures[future]
                     logger.warning("Failed to fetch metadata for %s: %s", url, e)
 
+        for ydl in downloaders:
+            ydl.close()
+
         return results
 
     @classmethod
@@ -549,11 +626,15 @@ class YtDlpService:
         if stop_event and stop_event.is_set():
             return None
 
-        ydl_opts = {**_METADATA_OPTS}
-
         try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=False)
+            # Reuse the worker's instance when running under
+            # _fetch_metadata_parallel, otherwise set one up for this call
+            worker_ydl = getattr(_metadata_worker, "ydl", None)
+            if worker_ydl is not None:
+                info = worker_ydl.extract_info(url, download=False)
+            else:
+                with yt_dlp.YoutubeDL({**_METADATA_OPTS}) as ydl:
+                    info = ydl.extract_info(url, download=False)
 
             if not info:
                 return None
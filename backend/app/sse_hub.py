@@ -45,6 +45,7 @@ class SSEHub:
 
     def __init__(self):
         self._subscribers: dict[str, set[asyncio.Queue]] = {}
+        self._generations: dict[str, int] = {}
         self._lock = asyncio.Lock()
         self._loop: asyncio.AbstractEventLoop | None = None
 
@@ -81,6 +82,21 @@ class SSEHub:
                     if not self._subscribers[channel]:
                         del self._subscribers[channel]
 
+    def generation(self, channel: str) -> int:
+        """
+        Get the number of updates dispatched to subscribers of a channel.
+
+        Data fetched for a channel stays current until its generation moves on,
+        so streams can use it to share one fetch between subscribers.
+
+        Args:
+            channel: The channel name.
+
+        Returns:
+            The channel's current generation.
+        """
+        return self._generations.get(channel, 0)
+
     def broadcast(self, *channels: str) -> None:
         """
         Broadcast updates to subscribers on one or more channels.
@@ -102,6 +118,7 @@ class SSEHub:
 
     def _dispatch(self, channel: str) -> None:
         """Dispatch update to all subscribers on a channel."""
+        self._generations[channel] = self._generations.get(channel, 0) + 1
         if channel not in self._subscribers:
             return
         for queue in self._subscribers.get(channel, set()):
@@ -6,7 +6,7 @@ Streams wait for notifications on a channel and fetch fresh data when notified.
 
 import asyncio
 import json
-from collections.abc import Callable
+from collections.abc import Callable, Hashable
 from typing import Any
 
 from fastapi import Request
@@ -15,6 +15,35 @@ from sse_starlette.sse import EventSourceResponse
 from app.extensions import sse_executor
 from app.sse_hub import hub
 
+# Pre-encoded frames skip sse_starlette's per-message line splitting and
+# encoding. The separator matches EventSourceResponse's default.
+SSE_LINE_END = b"\r\n\r\n"
+SSE_HEARTBEAT = b": heartbeat" + SSE_LINE_END
+
+# Reused for every SSE payload. json.dumps builds a new encoder per call when
+# given a default, so keep one around; it still uses the C accelerator.
+_encoder = json.JSONEncoder(default=str)
+
+# Serialised payloads shared between streams with the same channel and key,
+# tagged with the channel generation they were fetched for
+_shared_payloads: dict[tuple, tuple[int, asyncio.Future]] = {}
+_shared_refcounts: dict[tuple, int] = {}
+
+
+def sse_data_frame(payload: str) -> bytes:
+    """
+    Build a complete SSE data frame from a JSON payload.
+
+    JSON output never contains raw newlines, so the payload fits on one data
+    line and EventSourceResponse can write the bytes straight through.
+    """
+    return b"data: " + payload.encode() + SSE_LINE_END
+
+
+def encode_sse_data(data: Any) -> bytes:
+    """Serialise data as an SSE data frame, stringifying non-JSON types."""
+    return sse_data_frame(_encoder.encode(data))
+
 
 def wants_sse(request: Request) -> bool:
     """Check if the client wants an SSE stream."""
@@ -38,10 +67,41 @@ def sse_cors_headers(request: Request) -> dict:
     }
 
 
+async def _fetch_serialised(fetch_data: Callable[[], Any]) -> bytes:
+    """Fetch data in the SSE executor and encode it as an SSE frame."""
+    event_loop = asyncio.get_running_loop()
+    data = await event_loop.run_in_executor(sse_executor, fetch_data)
+    return encode_sse_data(data)
+
+
+async def _fetch_shared(
+    channel: str, shared_key: tuple, fetch_data: Callable[[], Any]
+) -> bytes:
+    """
+    Fetch a payload once per channel generation for all streams sharing a key.
+
+    The first stream to ask after a notification starts the fetch; the others
+    await the same future and reuse the encoded frame.
+    """
+    generation = hub.generation(channel)
+    cached = _shared_payloads.get(shared_key)
+
+    if cached is not None and cached[0] == generation:
+        future = cached[1]
+        failed = future.done() and (future.cancelled() or future.exception())
+        if not failed:
+            return await asyncio.shield(future)
+
+    future = asyncio.ensure_future(_fetch_serialised(fetch_data))
+    _shared_payloads[shared_key] = (generation, future)
+    return await asyncio.shield(future)
+
+
 async def create_sse_stream(
     channel: str,
     fetch_data: Callable[[], Any],
     heartbeat_interval: int = 30,
+    cache_key: Hashable | None = None,
 ):
     """
     Create a pure pub/sub SSE stream generator.
@@ -52,30 +112,46 @@ async def create_sse_stream(
         channel: SSE hub channel to subscribe to.
         fetch_data: Function returning data to send (called in executor).
         heartbeat_interval: Seconds between heartbeat comments.
+        cache_key: Identifies the request parameters behind fetch_data. Streams
+            on the same channel with the same key share one fetch per update.
 
     Yields:
-        SSE event dicts with 'data' or 'comment' keys.
+        Encoded SSE frames: data payloads or heartbeat comments.
     """
-    event_loop = asyncio.get_running_loop()
-
-    # Send initial data immediately
-    data = await event_loop.run_in_executor(sse_executor, fetch_data)
-    yield {"data": json.dumps(data, default=str)}
-
-    async with hub.subscribe(channel) as notification_queue:
-        while True:
-            try:
-                await asyncio.wait_for(
-                    notification_queue.get(), timeout=heartbeat_interval
-                )
-
-                # Received notification - fetch and send fresh data
-                data = await event_loop.run_in_executor(sse_executor, fetch_data)
-                yield {"data": json.dumps(data, default=str)}
-
-            except TimeoutError:
-                # No notification within heartbeat interval - send heartbeat
-                yield {"comment": "heartbeat"}
+    shared_key = None if cache_key is None else (channel, cache_key)
+
+    async def fetch_payload() -> bytes:
+        if shared_key is None:
+            return await _fetch_serialised(fetch_data)
+        return await _fetch_shared(channel, shared_key, fetch_data)
+
+    if shared_key is not None:
+        _shared_refcounts[shared_key] = _shared_refcounts.get(shared_key, 0) + 1
+
+    try:
+        # Subscribe before the initial fetch so no update can slip in between
+        async with hub.subscribe(channel) as notification_queue:
+            # Send initial data immediately
+            yield await fetch_payload()
+
+            while True:
+                try:
+                    await asyncio.wait_for(
+                        notification_queue.get(), timeout=heartbeat_interval
+                    )
+
+                    # Received notification - fetch and send fresh data
+                    yield await fetch_payload()
+
+                except TimeoutError:
+                    # No notification within heartbeat interval - send heartbeat
+                    yield SSE_HEARTBEAT
+    finally:
+        if shared_key is not None:
+            _shared_refcounts[shared_key] -= 1
+            if not _shared_refcounts[shared_key]:
+                del _shared_refcounts[shared_key]
+                _shared_payloads.pop(shared_key, None)
 
 
 def sse_response(
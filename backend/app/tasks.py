@@ -88,9 +88,13 @@ def _execute_sync(list_id: int) -> dict:
         if not video_list.profile.include_shorts:
             url = _append_videos_path(url)
 
-        # Get existing video IDs to skip during extraction
+        # Get existing video IDs to skip during extraction. Stream the rows in
+        # chunks so large lists don't build an intermediate row list.
         existing_video_ids = {
-            v[0] for v in db.query(Video.video_id).filter_by(list_id=list_id).all()
+            video_id
+            for (video_id,) in db.query(Video.video_id)
+            .filter_by(list_id=list_id)
+            .yield_per(1000)
         }
 
         include_shorts = video_list.profile.include_shorts
@@ -147,22 +151,22 @@ def _execute_sync(list_id: int) -> dict:
                         blacklisted=is_blacklisted,
                         error_message=blacklist_reason,
                     )
-                    db_inner.add(video)
-                    db_inner.commit()
+                    # Video row and its history entry share one commit
+                    with HistoryService.batch(db_inner) as history:
+                        db_inner.add(video)
+                        db_inner.flush()
+                        history.log(
+                            HistoryAction.VIDEO_DISCOVERED,
+                            "video",
+                            video.id,
+                            {
+                                "name": list_name,
+                                "title": video_data["title"],
+                                "list_id": list_id,
+                                "blacklisted": is_blacklisted,
+                            },
+                        )
                     counters["new"] += 1
-
-                    HistoryService.log(
-                        db_inner,
-                        HistoryAction.VIDEO_DISCOVERED,
-                        "video",
-                        video.id,
-                        {
-                            "name": list_name,
-                            "title": video_data["title"],
-                            "list_id": list_id,
-                            "blacklisted": is_blacklisted,
-                        },
-                    )
                     broadcast(Channel.list_videos(list_id))
 
                     # Immediately queue download if auto_download enabled and not blacklisted
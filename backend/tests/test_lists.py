@@ -577,6 +577,15 @@ class TestDeleteList:
         response = client.delete(f"/api/lists/{sample_list}")
         assert response.status_code == 409
 
+    def test_delete_list_drops_cached_active_tasks(self, app, sample_list):
+        """Should evict the deleted list's active tasks from the cache."""
+        from app.routes import lists
+
+        lists._active_tasks_cache[sample_list] = (0, {})
+        lists._delete_list_background(sample_list, "Test List")
+
+        assert sample_list not in lists._active_tasks_cache
+
 
 class TestGetListTasks:
     """Tests for GET /api/lists/{list_id}/tasks."""
@@ -635,6 +644,21 @@ class TestGetListVideos:
         assert "total_pages" in data
         assert len(data["videos"]) == 1
 
+    def test_get_videos_page_includes_filesize(
+        self, client, db_session, sample_list, sample_video
+    ):
+        """Should keep filesize in the trimmed video summary."""
+        from app.models import Video
+
+        video = db_session.get(Video, sample_video)
+        video.filesize = 2048
+        db_session.commit()
+
+        response = client.get(f"/api/lists/{sample_list}/videos")
+
+        assert response.status_code == 200
+        assert response.json()["videos"][0]["filesize"] == 2048
+
     def test_get_videos_page_not_found(self, client):
         """Should return 404 for non-existent list."""
         response = client.get("/api/lists/9999/videos")
@@ -688,6 +712,189 @@ class TestGetListVideoStats:
 
         assert response.status_code == 404
 
+    def test_get_stats_groups_active_tasks(
+        self, client, db_session, sample_list, sample_video, sample_task
+    ):
+        """Should group active sync and download tasks by type and status."""
+        from app.models.task import Task, TaskStatus, TaskType
+
+        db_session.add_all(
+            [
+                Task(
+                    task_type=TaskType.DOWNLOAD.value,
+                    entity_id=sample_video,
+                    status=TaskStatus.RUNNING.value,
+                ),
+                Task(
+                    task_type=TaskType.DOWNLOAD.value,
+                    entity_id=sample_video,
+                    status=TaskStatus.COMPLETED.value,
+                ),
+            ]
+        )
+        db_session.commit()
+
+        response = client.get(f"/api/lists/{sample_list}/videos/stats")
+
+        assert response.status_code == 200
+        assert response.json()["tasks"] == {
+            "sync": {"pending": [sample_list], "running": []},
+            "download": {"pending": [], "running": [sample_video]},
+        }
+
+    def test_fetch_changed_videos_resumes_from_watermark(self, db_session, sample_list):
+        """Should page through changes by (updated_at, id) without skipping ties."""
+        from datetime import datetime
+
+        from app.models import Video
+        from app.routes.lists import _fetch_changed_videos
+
+        updated_at = datetime(2024, 1, 1, 12, 0, 0)
+        videos = [
+            Video(
+                video_id=f"v{i}",
+                title=f"Video {i}",
+                url=f"https://youtube.com/watch?v=v{i}",
+                list_id=sample_list,
+            )
+            for i in range(3)
+        ]
+        db_session.add_all(videos)
+        db_session.flush()
+        for video in videos:
+            video.updated_at = updated_at
+        db_session.commit()
+        ids = sorted(v.id for v in videos)
+
+        first = _fetch_changed_videos(
+            db_session, sample_list, (datetime(2024, 1, 1), 0), limit=2
+        )
+        assert [video_id for video_id, _ in first] == ids[:2]
+
+        last_id, last_updated = first[-1]
+        rest = _fetch_changed_videos(
+            db_session, sample_list, (last_updated, last_id), limit=2
+        )
+        assert [video_id for video_id, _ in rest] == ids[2:]
+
+    def test_active_tasks_cached_until_tasks_change(
+        self, db_session, sample_list, sample_task
+    ):
+        """Should reuse cached active tasks until a task write commits."""
+        from app.models.task import Task, TaskStatus
+        from app.routes import lists
+
+        lists._active_tasks_cache.clear()
+        with patch.object(
+            lists, "_fetch_active_tasks", wraps=lists._fetch_active_tasks
+        ) as fetch:
+            first = lists._fetch_active_tasks_cached(db_session, sample_list)
+            assert lists._fetch_active_tasks_cached(db_session, sample_list) is first
+            assert fetch.call_count == 1
+
+            task = db_session.get(Task, sample_task)
+            task.status = TaskStatus.RUNNING.value
+            db_session.commit()
+
+            updated = lists._fetch_active_tasks_cached(db_session, sample_list)
+            assert fetch.call_count == 2
+            assert updated["sync"]["running"] == [sample_list]
+
+    def test_active_tasks_cache_drops_stale_versions(self, db_session, sample_list):
+        """Should keep only entries for the current task version."""
+        from app.routes import lists
+
+        lists._active_tasks_cache.clear()
+        lists._active_tasks_cache[sample_list + 1] = (-1, {})
+        lists._fetch_active_tasks_cached(db_session, sample_list)
+
+        assert set(lists._active_tasks_cache) == {sample_list}
+
+    def test_active_tasks_query_avoids_server_side_cursors(self):
+        """Should not stream, as the autocommit read engine can't on PostgreSQL."""
+        from app.routes import lists
+
+        options = lists._ACTIVE_TASKS_STMT.get_execution_options()
+        assert "yield_per" not in options
+        assert not options.get("stream_results")
+
+    async def test_stats_stream_skips_notifications_without_changes(
+        self, db_session, sample_list, sample_video
+    ):
+        """Should send nothing when neither videos nor tasks have changed."""
+        import asyncio
+        import json
+        from unittest.mock import MagicMock
+
+        from app.models import Video
+        from app.routes.lists import get_list_video_stats
+        from app.sse_hub import Channel, SSEHub
+
+        hub = SSEHub()
+        request = MagicMock()
+        request.headers = {"accept": "text/event-stream"}
+
+        with patch("app.routes.lists.hub", hub):
+            response = await get_list_video_stats(sample_list, request)
+            stream = response.body_iterator
+            await stream.__anext__()
+
+            pending = asyncio.ensure_future(stream.__anext__())
+            while not hub._subscribers:
+                await asyncio.sleep(0.01)
+            hub._dispatch(Channel.list_videos(sample_list))
+            await asyncio.sleep(0.1)
+            assert not pending.done()
+
+            video = db_session.get(Video, sample_video)
+            video.downloaded = True
+            db_session.commit()
+            hub._dispatch(Channel.list_videos(sample_list))
+
+            message = await asyncio.wait_for(pending, timeout=5)
+            payload = json.loads(message.removeprefix(b"data: "))
+            assert payload["changed_video_ids"] == [sample_video]
+            assert payload["stats"]["downloaded"] == 1
+            await stream.aclose()
+
+    async def test_stats_stream_sends_late_committed_changes(
+        self, db_session, sample_list, sample_video
+    ):
+        """Should send rows committed with updated_at behind the watermark."""
+        import asyncio
+        import json
+        from datetime import datetime, timedelta
+        from unittest.mock import MagicMock
+
+        from app.models import Video
+        from app.routes.lists import get_list_video_stats
+        from app.sse_hub import Channel, SSEHub
+
+        hub = SSEHub()
+        request = MagicMock()
+        request.headers = {"accept": "text/event-stream"}
+
+        with patch("app.routes.lists.hub", hub):
+            response = await get_list_video_stats(sample_list, request)
+            stream = response.body_iterator
+            await stream.__anext__()
+
+            # Stamped a moment before the stream's watermark, committed after
+            video = db_session.get(Video, sample_video)
+            video.title = "Renamed"
+            video.updated_at = datetime.utcnow() - timedelta(seconds=1)
+            db_session.commit()
+
+            pending = asyncio.ensure_future(stream.__anext__())
+            while not hub._subscribers:
+                await asyncio.sleep(0.01)
+            hub._dispatch(Channel.list_videos(sample_list))
+
+            message = await asyncio.wait_for(pending, timeout=5)
+            payload = json.loads(message.removeprefix(b"data: "))
+            assert payload["changed_video_ids"] == [sample_video]
+            await stream.aclose()
+
 
 class TestGetListVideosByIds:
     """Tests for GET /api/lists/{list_id}/videos/by-ids."""
@@ -2,7 +2,7 @@
 
 from datetime import datetime, timedelta
 
-from app.models import Profile, Video, VideoList
+from app.models import Profile, Settings, Video, VideoList
 from app.models.task import Task, TaskLogLevel, TaskStatus, TaskType
 
 
@@ -342,3 +342,63 @@ class TestTaskBatchGetEntityNames:
         result = Task.batch_get_entity_names(db_session, [task])
         assert task.id in result
         assert result[task.id] == "Test Video"
+
+
+class TestTasksVersion:
+    """Tests for the task table version counter."""
+
+    def test_bumps_on_task_commit(self, db_session, sample_list):
+        """Should advance when a transaction writing a task commits."""
+        from app.models.task import tasks_version
+
+        before = tasks_version()
+        task = Task(task_type=TaskType.SYNC.value, entity_id=sample_list)
+        db_session.add(task)
+        db_session.flush()
+        assert tasks_version() == before
+
+        db_session.commit()
+        assert tasks_version() == before + 1
+
+    def test_bumps_on_bulk_update(self, db_session, sample_task):
+        """Should advance for query().update() writes that skip the flush."""
+        from app.models.task import tasks_version
+
+        before = tasks_version()
+        db_session.query(Task).filter(Task.id == sample_task).update(
+            {Task.status: TaskStatus.CANCELLED.value}, synchronize_session=False
+        )
+        db_session.commit()
+
+        assert tasks_version() == before + 1
+
+    def test_unchanged_by_other_writes_or_rollback(self, db_session, sample_list):
+        """Should ignore commits without task writes and rolled-back writes."""
+        from app.models.task import tasks_version
+
+        before = tasks_version()
+        db_session.add(Task(task_type=TaskType.SYNC.value, entity_id=sample_list))
+        db_session.flush()
+        db_session.rollback()
+
+        video_list = db_session.get(VideoList, sample_list)
+        video_list.name = "Renamed"
+        db_session.commit()
+
+        assert tasks_version() == before
+
+
+class TestSettingsVersion:
+    """Tests for the settings table version counter."""
+
+    def test_counts_separately_from_tasks(self, db_session):
+        """Should advance on settings commits without touching the task version."""
+        from app.models.settings import settings_version
+        from app.models.task import tasks_version
+
+        settings_before = settings_version()
+        tasks_before = tasks_version()
+        Settings.set(db_session, "versioned_key", "value")
+
+        assert settings_version() == settings_before + 1
+        assert tasks_version() == tasks_before
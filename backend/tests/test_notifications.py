@@ -114,6 +114,18 @@ class TestHTTPNotifier:
         assert success is False
         assert "not found" in msg.lower()
 
+    def test_reuses_session(self):
+        notifier = PlexNotifier({})
+        assert notifier._session is notifier._session
+
+    def test_close_releases_session(self):
+        notifier = PlexNotifier({})
+        session = notifier._session
+        with patch.object(session, "close") as mock_close:
+            notifier.close()
+        mock_close.assert_called_once()
+        assert notifier._session is not session
+
 
 class TestPlexNotifier:
     """Tests for PlexNotifier."""
@@ -613,6 +625,63 @@ class TestNotificationService:
                 {"list_name": "Test Channel", "new_videos": 5, "total": 100},
             )
 
+    def test_send_rereads_settings_after_write(self, app, db_session):
+        from app.models import Settings
+
+        Settings.set_bool(db_session, "notification_plex_enabled", True)
+        Settings.set_bool(db_session, "notification_plex_event_sync_completed", True)
+
+        with patch.object(PlexNotifier, "notify", return_value=True) as mock_notify:
+            assert NotificationService.send(Event.SYNC_COMPLETED, {}) == {"plex": True}
+
+            Settings.set_bool(db_session, "notification_plex_enabled", False)
+            assert NotificationService.send(Event.SYNC_COMPLETED, {}) == {}
+
+        mock_notify.assert_called_once()
+
+    def test_config_change_leaves_previous_notifier_open(self):
+        """A replaced notifier may still be in use by an in-flight send."""
+        first = NotificationService._get_notifier(GotifyNotifier, '{"priority": "1"}')
+
+        with patch.object(first, "close") as mock_close:
+            second = NotificationService._get_notifier(
+                GotifyNotifier, '{"priority": "2"}'
+            )
+
+        assert second is not first
+        mock_close.assert_not_called()
+
+    def test_shutdown_stops_pool_without_waiting(self):
+        from app.services.notifications import service
+
+        pool = NotificationService._get_pool()
+        with patch.object(pool, "shutdown") as mock_shutdown:
+            NotificationService.shutdown()
+
+        mock_shutdown.assert_called_once_with(wait=False, cancel_futures=True)
+        assert service._pool is None
+        pool.shutdown()
+
+    def test_app_shutdown_stops_notification_pool(self, app):
+        from app import _shutdown
+
+        with patch.object(NotificationService, "shutdown") as mock_shutdown:
+            _shutdown(app)
+
+        mock_shutdown.assert_called_once()
+
+    def test_test_route_closes_notifier(self, client):
+        with (
+            patch.object(GotifyNotifier, "test_connection", return_value=(True, "ok")),
+            patch.object(GotifyNotifier, "close") as mock_close,
+        ):
+            response = client.post(
+                "/api/notifications/gotify/test", json={"config": {}}
+            )
+
+        assert response.json() == {"success": True, "message": "ok"}
+        mock_close.assert_called_once()
+
 
 class TestBaseNotifierSubclassing:
     """Tests for BaseNotifier registration and dispatch."""
@@ -348,6 +348,26 @@ class TestCreateProfile:
         assert data["sponsorblock_behaviour"] == "delete"
         assert data["sponsorblock_categories"] == ["sponsor", "intro"]
 
+    def test_create_profile_subtitle_languages_normalised(self, client):
+        """Should store subtitle languages as a clean comma-separated string."""
+        response = client.post(
+            "/api/profiles",
+            json={"name": "Subtitles", "subtitle_languages": " en, es ,,fr"},
+        )
+
+        assert response.status_code == 201
+        assert response.json()["subtitle_languages"] == "en,es,fr"
+
+    def test_create_profile_subtitle_languages_list(self, client):
+        """Should accept subtitle languages as a list."""
+        response = client.post(
+            "/api/profiles",
+            json={"name": "Subtitle List", "subtitle_languages": ["en", "de"]},
+        )
+
+        assert response.status_code == 201
+        assert response.json()["subtitle_languages"] == "en,de"
+
     def test_create_profile_with_include_live_false(self, client):
         """Should create profile with include_live disabled."""
         response = client.post(
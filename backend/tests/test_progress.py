@@ -1,5 +1,6 @@
 """Tests for progress API endpoints."""
 
+import asyncio
 from unittest.mock import patch
 
 
@@ -28,3 +29,60 @@ class TestGetProgress:
 
         assert response.status_code == 200
         assert response.json() == {}
+
+
+class TestProgressStream:
+    """Tests for the progress SSE stream."""
+
+    @staticmethod
+    def _sse_request():
+        from unittest.mock import MagicMock
+
+        request = MagicMock()
+        request.headers = {"accept": "text/event-stream"}
+        return request
+
+    async def test_stream_sends_initial_state_then_heartbeats(self):
+        """Should send current progress, then heartbeat when nothing changes."""
+        from app.routes.progress import get_progress
+
+        with (
+            patch("app.routes.progress.HEARTBEAT_SECONDS", 0.01),
+            patch("app.services.progress_service.snapshot", return_value=(0, {})),
+        ):
+            response = await get_progress(self._sse_request())
+            stream = response.body_iterator
+
+            assert await stream.__anext__() == b"data: {}\r\n\r\n"
+            assert await stream.__anext__() == b": heartbeat\r\n\r\n"
+            await stream.aclose()
+
+    async def test_stream_pushes_on_notification(self):
+        """Should send new data as soon as the progress channel is notified."""
+        from app.routes.progress import get_progress
+        from app.sse_hub import Channel, SSEHub
+
+        hub = SSEHub()
+        progress = [(0, {}), (1, {1: {"video_id": 1, "status": "downloading"}})]
+
+        with (
+            patch("app.routes.progress.hub", hub),
+            patch(
+                "app.services.progress_service.snapshot",
+                side_effect=lambda: progress[0],
+            ),
+        ):
+            response = await get_progress(self._sse_request())
+            stream = response.body_iterator
+
+            assert await stream.__anext__() == b"data: {}\r\n\r\n"
+
+            progress.pop(0)
+            pending = asyncio.ensure_future(stream.__anext__())
+            await asyncio.sleep(0)
+            hub.broadcast(Channel.PROGRESS)
+
+            message = await asyncio.wait_for(pending, timeout=1)
+            assert isinstance(message, bytes)
+            assert b'"downloading"' in message
+            await stream.aclose()
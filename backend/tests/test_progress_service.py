@@ -1,6 +1,7 @@
 """Tests for progress_service module."""
 
 import time
+from unittest.mock import patch
 
 from app.services import progress_service
 
@@ -13,6 +14,7 @@ class TestProgressService:
         with progress_service._lock:
             progress_service._store.clear()
             progress_service._timestamps.clear()
+            progress_service._serialised.clear()
 
     def test_get_all_empty(self):
         """Should return empty dict when no progress entries."""
@@ -85,6 +87,21 @@ class TestProgressService:
         assert result[102]["status"] == "error"
         assert result[102]["error"] == "Network timeout"
 
+    def test_hook_uses_byte_counts_for_percent(self):
+        """Should prefer byte counts over the formatted percent string."""
+        hook = progress_service.create_hook(104)
+
+        hook(
+            {
+                "status": "downloading",
+                "downloaded_bytes": 250,
+                "total_bytes_estimate": 1000,
+                "_percent_str": "invalid",
+            }
+        )
+
+        assert progress_service.get_all()[104]["percent"] == 25.0
+
     def test_hook_handles_invalid_percent(self):
         """Should handle invalid percent string gracefully."""
         hook = progress_service.create_hook(103)
@@ -94,6 +111,14 @@ class TestProgressService:
         result = progress_service.get_all()
         assert result[103]["percent"] == 0.0
 
+    def test_hook_parses_coloured_percent(self):
+        """Should read the percent from ANSI-coloured progress strings."""
+        hook = progress_service.create_hook(105)
+
+        hook({"status": "downloading", "_percent_str": "\x1b[0;94m 42.5%\x1b[0m"})
+
+        assert progress_service.get_all()[105]["percent"] == 42.5
+
     def test_stale_entries_cleaned_up(self):
         """Should clean up entries older than TTL."""
         progress_service.create_hook(200)
@@ -101,7 +126,7 @@ class TestProgressService:
         # Manually set timestamp to be stale
         with progress_service._lock:
             progress_service._timestamps[200] = (
-                time.time() - progress_service.TTL_SECONDS - 1
+                time.monotonic() - progress_service.TTL_SECONDS - 1
             )
 
         result = progress_service.get_all()
@@ -118,3 +143,96 @@ class TestProgressService:
         assert result[1]["status"] == "completed"
         assert result[2]["status"] == "error"
         assert result[3]["status"] == "pending"
+
+    def test_snapshot_reserialises_only_changed_entries(self):
+        """Should reuse dicts for entries that have not changed."""
+        progress_service.mark_done(1)
+        progress_service.mark_error(2, "failed")
+        _, first = progress_service.snapshot()
+
+        progress_service.mark_retrying(2, 2, 3)
+        _, second = progress_service.snapshot()
+
+        assert second[1] is first[1]
+        assert second[2] is not first[2]
+        assert second[2]["status"] == "retrying"
+
+    def test_snapshot_version_tracks_changes(self):
+        """Should advance the version on updates and TTL cleanup only."""
+        start, _ = progress_service.snapshot()
+        assert progress_service.snapshot()[0] == start
+
+        progress_service.mark_done(1)
+        version, result = progress_service.snapshot()
+        assert version == start + 1
+        assert result[1]["status"] == "completed"
+
+        with progress_service._lock:
+            progress_service._timestamps[1] = (
+                time.monotonic() - progress_service.TTL_SECONDS - 1
+            )
+        version, result = progress_service.snapshot()
+        assert version == start + 2
+        assert result == {}
+
+
+class TestProgressBroadcast:
+    """Tests for progress broadcast coalescing."""
+
+    def setup_method(self):
+        """Forget broadcasts made by earlier tests."""
+        progress_service._last_broadcast = float("-inf")
+
+    def test_state_changes_broadcast_immediately(self):
+        """Should broadcast every state transition, however close together."""
+        with patch("app.services.progress_service.broadcast") as mock_broadcast:
+            progress_service.mark_done(1)
+            progress_service.mark_error(1, "failed")
+
+        assert mock_broadcast.call_count == 2
+
+    def test_download_ticks_share_one_broadcast(self):
+        """Should broadcast once for a burst of ticks within the interval."""
+        hook = progress_service.create_hook(2)
+        progress_service._last_broadcast = float("-inf")
+
+        with (
+            patch("app.services.progress_service.time.monotonic", return_value=100.0),
+            patch("app.services.progress_service.broadcast") as mock_broadcast,
+        ):
+            for percent in range(10):
+                hook({"status": "downloading", "_percent_str": f"{percent}%"})
+
+        mock_broadcast.assert_called_once()
+        assert progress_service.get_all()[2]["percent"] == 9.0
+
+    def test_tick_after_interval_broadcasts_again(self):
+        """Should broadcast a tick once the interval since the last one has passed."""
+        hook = progress_service.create_hook(3)
+        progress_service._last_broadcast = float("-inf")
+        later = 100.0 + progress_service.BROADCAST_INTERVAL * 2
+
+        with (
+            patch(
+                "app.services.progress_service.time.monotonic",
+                side_effect=[100.0, 100.0, later, later],
+            ),
+            patch("app.services.progress_service.broadcast") as mock_broadcast,
+        ):
+            hook({"status": "downloading", "_percent_str": "10%"})
+            hook({"status": "downloading", "_percent_str": "20%"})
+
+        assert mock_broadcast.call_count == 2
+
+    def test_ticks_skipped_after_state_change(self):
+        """Should count a state transition's broadcast towards the interval."""
+        hook = progress_service.create_hook(4)
+
+        with (
+            patch("app.services.progress_service.time.monotonic", return_value=100.0),
+            patch("app.services.progress_service.broadcast") as mock_broadcast,
+        ):
+            progress_service.flush()
+            hook({"status": "downloading", "_percent_str": "10%"})
+
+        mock_broadcast.assert_called_once()
@@ -1,6 +1,8 @@
 """Tests for HistoryService."""
 
-from app.models import HistoryAction
+import pytest
+
+from app.models import HistoryAction, Profile
 from app.services import HistoryService
 
 
@@ -56,6 +58,31 @@ class TestHistoryServiceLog:
         assert entry.entity_id is None
 
 
+class TestHistoryServiceBatch:
+    """Tests for HistoryService.batch context manager."""
+
+    def test_commits_queued_entries_together(self, db_session):
+        """Should write every queued entry on exit."""
+        with HistoryService.batch(db_session) as history:
+            history.log(HistoryAction.VIDEO_DISCOVERED, "video", entity_id=1)
+            history.log(HistoryAction.VIDEO_DISCOVERED, "video", entity_id=2)
+
+        entries = HistoryService.get_all(db_session, entity_type="video")
+        assert {e.entity_id for e in entries} == {1, 2}
+
+    def test_rolls_back_on_error(self, db_session):
+        """Should write neither entries nor other pending changes on error."""
+        with pytest.raises(RuntimeError):
+            with HistoryService.batch(db_session) as history:
+                db_session.add(Profile(name="Pending"))
+                db_session.flush()
+                history.log(HistoryAction.VIDEO_DISCOVERED, "video", entity_id=1)
+                raise RuntimeError("boom")
+
+        assert HistoryService.get_all(db_session, entity_type="video") == []
+        assert db_session.query(Profile).filter_by(name="Pending").first() is None
+
+
 class TestHistoryServiceGetAll:
     """Tests for HistoryService.get_all method."""
 
@@ -5,12 +5,17 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from app.services import ytdlp_service
 from app.services.ytdlp_service import YtDlpService
 
 
 class TestExtractListMetadata:
     """Tests for YtDlpService.extract_list_metadata method."""
 
+    def setup_method(self):
+        """Start each test without cached metadata."""
+        ytdlp_service._list_metadata_cache.clear()
+
     @patch("app.services.ytdlp_service.yt_dlp.YoutubeDL")
     def test_extracts_metadata(self, mock_ydl_class):
         """Should extract channel/playlist metadata."""
@@ -150,6 +155,37 @@ class TestExtractListMetadata:
 
         assert result["channel_id"] == "playlist123"
 
+    @patch("app.services.ytdlp_service.yt_dlp.YoutubeDL")
+    def test_reuses_recent_result(self, mock_ydl_class):
+        """Should not call yt-dlp again for a URL fetched within the TTL."""
+        mock_ydl = MagicMock()
+        mock_ydl_class.return_value.__enter__.return_value = mock_ydl
+        mock_ydl.extract_info.return_value = {"title": "Test", "thumbnails": []}
+
+        first = YtDlpService.extract_list_metadata("https://youtube.com/c/test")
+        second = YtDlpService.extract_list_metadata("https://youtube.com/c/test")
+
+        assert second == first
+        mock_ydl.extract_info.assert_called_once()
+
+    @patch("app.services.ytdlp_service.yt_dlp.YoutubeDL")
+    def test_refetches_after_ttl(self, mock_ydl_class):
+        """Should call yt-dlp again once the cached result has expired."""
+        mock_ydl = MagicMock()
+        mock_ydl_class.return_value.__enter__.return_value = mock_ydl
+        mock_ydl.extract_info.return_value = {"title": "Test", "thumbnails": []}
+
+        url = "https://youtube.com/c/test"
+        YtDlpService.extract_list_metadata(url)
+        fetched, metadata = ytdlp_service._list_metadata_cache[url]
+        ytdlp_service._list_metadata_cache[url] = (
+            fetched - ytdlp_service.LIST_METADATA_TTL,
+            metadata,
+        )
+        YtDlpService.extract_list_metadata(url)
+
+        assert mock_ydl.extract_info.call_count == 2
+
 
 class TestExtractVideos:
     """Tests for YtDlpService.extract_videos method."""
@@ -316,6 +352,22 @@ class TestExtractVideoEntries:
         assert len(result) == 1
         assert result[0]["video_id"] == "nested1"
 
+    @patch("app.services.ytdlp_service.yt_dlp.YoutubeDL")
+    def test_ignores_flat_entries_before_nested_group(self, mock_ydl_class):
+        """Should drop flat entries even when they precede a nested group."""
+        mock_ydl = MagicMock()
+        mock_ydl_class.return_value.__enter__.return_value = mock_ydl
+        mock_ydl.extract_info.return_value = {
+            "entries": [
+                {"id": "flat1", "webpage_url": "https://url2"},
+                {"entries": [{"id": "nested1", "webpage_url": "https://url1"}]},
+            ]
+        }
+
+        result = YtDlpService._extract_video_entries("https://youtube.com/c/test")
+
+        assert [entry["video_id"] for entry in result] == ["nested1"]
+
     @patch("app.services.ytdlp_service.yt_dlp.YoutubeDL")
     def test_handles_none_entries_in_list(self, mock_ydl_class):
         """Should skip None entries in the list."""
@@ -1124,7 +1176,7 @@ class TestDownloadVideo:
 class TestDownloadListArtwork:
     """Tests for YtDlpService.download_list_artwork method."""
 
-    @patch("app.services.ytdlp_service.requests.get")
+    @patch("app.services.ytdlp_service._session.get")
     def test_downloads_all_artwork(self, mock_get, tmp_path):
         """Should download fanart, poster, and banner from thumbnails."""
         mock_response = MagicMock()
@@ -1147,7 +1199,7 @@ class TestDownloadListArtwork:
         assert (tmp_path / "poster.jpg").exists()
         assert (tmp_path / "banner.jpg").exists()
 
-    @patch("app.services.ytdlp_service.requests.get")
+    @patch("app.services.ytdlp_service._session.get")
     def test_handles_missing_thumbnails(self, mock_get, tmp_path):
         """Should return False for missing thumbnail IDs."""
         mock_response = MagicMock()
@@ -1165,7 +1217,7 @@ class TestDownloadListArtwork:
         assert results["poster.jpg"] is False
         assert results["banner.jpg"] is False
 
-    @patch("app.services.ytdlp_service.requests.get")
+    @patch("app.services.ytdlp_service._session.get")
     def test_handles_download_failure(self, mock_get, tmp_path):
         """Should return False when download fails."""
         import requests
@@ -1188,7 +1240,7 @@ class TestDownloadListArtwork:
         assert results["poster.jpg"] is False
         assert results["banner.jpg"] is False
 
-    @patch("app.services.ytdlp_service.requests.get")
+    @patch("app.services.ytdlp_service._session.get")
     def test_creates_output_directory(self, mock_get, tmp_path):
         """Should create output directory if it doesn't exist."""
         mock_response = MagicMock()
@@ -1213,7 +1265,7 @@ class TestDownloadListArtwork:
             {"id": "0", "url": "https://example.com/second.jpg"},  # Duplicate
         ]
 
-        with patch("app.services.ytdlp_service.requests.get") as mock_get:
+        with patch("app.services.ytdlp_service._session.get") as mock_get:
             mock_response = MagicMock()
             mock_response.content = b"image data"
             mock_response.raise_for_status = MagicMock()
@@ -1230,7 +1282,7 @@ class TestDownloadListArtwork:
             {"id": 0, "url": "https://example.com/banner.jpg"},  # Numeric ID
         ]
 
-        with patch("app.services.ytdlp_service.requests.get") as mock_get:
+        with patch("app.services.ytdlp_service._session.get") as mock_get:
             mock_response = MagicMock()
             mock_response.content = b"image data"
             mock_response.raise_for_status = MagicMock()
@@ -1247,7 +1299,7 @@ class TestDownloadListArtwork:
             {"id": "0", "url": "https://example.com/banner.jpg"},
         ]
 
-        with patch("app.services.ytdlp_service.requests.get") as mock_get:
+        with patch("app.services.ytdlp_service._session.get") as mock_get:
             mock_response = MagicMock()
             mock_response.content = b"image data"
             mock_response.raise_for_status = MagicMock()
@@ -1261,7 +1313,7 @@ class TestDownloadListArtwork:
 class TestDownloadImage:
     """Tests for YtDlpService._download_image method."""
 
-    @patch("app.services.ytdlp_service.requests.get")
+    @patch("app.services.ytdlp_service._session.get")
     def test_downloads_image(self, mock_get, tmp_path):
         """Should download and save image."""
         mock_response = MagicMock()
@@ -1278,7 +1330,7 @@ class TestDownloadImage:
         assert output_path.exists()
         assert output_path.read_bytes() == b"image data"
 
-    @patch("app.services.ytdlp_service.requests.get")
+    @patch("app.services.ytdlp_service._session.get")
     def test_handles_http_error(self, mock_get, tmp_path):
         """Should return False on HTTP error."""
         import requests
@@ -1477,3 +1529,22 @@ class TestWriteVideoNfo:
         result = YtDlpService.write_video_nfo(video, video_path)
 
         assert result is True
+
+    def test_episode_number_is_stable(self, app, db_session, sample_list, tmp_path):
+        """Should derive the episode number from the video ID deterministically."""
+        from app.models import Video
+
+        video = Video(
+            video_id="episode123",
+            title="Episode Video",
+            url="https://youtube.com/watch?v=episode123",
+            list_id=sample_list,
+        )
+        db_session.add(video)
+        db_session.commit()
+
+        video_path = str(tmp_path / "video.mp4")
+        YtDlpService.write_video_nfo(video, video_path)
+
+        content = (tmp_path / "video.nfo").read_text()
+        assert "<episode>157122</episode>" in content
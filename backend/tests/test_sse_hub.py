@@ -126,6 +126,19 @@ class TestSSEHub:
             # This should not raise even though queue is full
             test_hub._dispatch("test_channel")
 
+    @pytest.mark.asyncio
+    async def test_dispatch_advances_generation(self):
+        """Should bump the channel generation on each dispatch."""
+        test_hub = SSEHub()
+        assert test_hub.generation("test_channel") == 0
+
+        async with test_hub.subscribe("test_channel"):
+            test_hub._dispatch("test_channel")
+            test_hub._dispatch("test_channel")
+
+        assert test_hub.generation("test_channel") == 2
+        assert test_hub.generation("other_channel") == 0
+
 
 class TestGlobalHub:
     """Tests for global hub instance and broadcast function."""
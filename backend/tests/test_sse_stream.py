@@ -68,8 +68,8 @@ class TestCreateSseStream:
                     # Get first message - should be immediate data
                     first_message = await stream.__anext__()
 
-                    assert "data" in first_message
-                    assert '"test": "data"' in first_message["data"]
+                    assert first_message.startswith(b"data: ")
+                    assert b'"test": "data"' in first_message
 
     @pytest.mark.asyncio
     async def test_sends_data_on_notification(self):
@@ -115,7 +115,7 @@ class TestCreateSseStream:
                     # Second message (notification triggered)
                     second_message = await stream.__anext__()
 
-                    assert "data" in second_message
+                    assert second_message.startswith(b"data: ")
 
     @pytest.mark.asyncio
     async def test_sends_heartbeat_on_timeout(self):
@@ -150,12 +150,63 @@ class TestCreateSseStream:
 
                     # First message (initial data)
                     first = await stream.__anext__()
-                    assert "data" in first
+                    assert first.startswith(b"data: ")
 
                     # Second message should be heartbeat after timeout
                     second = await stream.__anext__()
-                    assert "comment" in second
-                    assert second["comment"] == "heartbeat"
+                    assert second == b": heartbeat\r\n\r\n"
+
+
+class TestSharedSseStream:
+    """Tests for streams sharing fetches via cache_key."""
+
+    @pytest.mark.asyncio
+    async def test_streams_with_same_key_share_fetch(self):
+        """Should fetch once per generation for streams with the same key."""
+        from app.sse_hub import SSEHub
+        from app.sse_stream import create_sse_stream
+
+        test_hub = SSEHub()
+        fetch_data = MagicMock(return_value={"test": "data"})
+
+        with patch("app.sse_stream.hub", test_hub):
+            first = create_sse_stream("test_channel", fetch_data, cache_key=1)
+            second = create_sse_stream("test_channel", fetch_data, cache_key=1)
+
+            assert (await first.__anext__()) == (await second.__anext__())
+            assert fetch_data.call_count == 1
+
+            test_hub._dispatch("test_channel")
+            await first.__anext__()
+            await second.__anext__()
+            assert fetch_data.call_count == 2
+
+            await first.aclose()
+            await second.aclose()
+
+    @pytest.mark.asyncio
+    async def test_streams_with_different_keys_fetch_separately(self):
+        """Should not share payloads between different keys."""
+        from app.sse_hub import SSEHub
+        from app.sse_stream import _shared_payloads, create_sse_stream
+
+        test_hub = SSEHub()
+        fetch_one = MagicMock(return_value={"page": 1})
+        fetch_two = MagicMock(return_value={"page": 2})
+
+        with patch("app.sse_stream.hub", test_hub):
+            first = create_sse_stream("test_channel", fetch_one, cache_key=1)
+            second = create_sse_stream("test_channel", fetch_two, cache_key=2)
+
+            assert b'"page": 1' in await first.__anext__()
+            assert b'"page": 2' in await second.__anext__()
+
+            await first.aclose()
+            await second.aclose()
+
+        # Shared payloads are dropped once no stream uses the key
+        assert ("test_channel", 1) not in _shared_payloads
+        assert ("test_channel", 2) not in _shared_payloads
 
 
 class TestSseResponse:
@@ -178,3 +229,25 @@ class TestSseResponse:
         from sse_starlette.sse import EventSourceResponse
 
         assert isinstance(response, EventSourceResponse)
+
+
+class TestEncodeSseData:
+    """Tests for pre-encoded SSE frames."""
+
+    def test_encodes_single_data_frame(self):
+        """Should produce one data line terminated by a blank line."""
+        from app.sse_stream import encode_sse_data
+
+        frame = encode_sse_data({"title": "line one\nline two"})
+
+        assert frame == b'data: {"title": "line one\\nline two"}\r\n\r\n'
+
+    def test_stringifies_non_json_types(self):
+        """Should fall back to str() for values JSON can't encode."""
+        from datetime import datetime
+
+        from app.sse_stream import encode_sse_data
+
+        frame = encode_sse_data({"at": datetime(2024, 1, 1)})
+
+        assert frame == b'data: {"at": "2024-01-01 00:00:00"}\r\n\r\n'
@@ -77,6 +77,18 @@ class TestTaskStats:
         assert "running_sync" in data
         assert "running_download" in data
 
+    def test_stats_stream_fetches_per_connection(self, client):
+        """Should not share stats between streams, as schedule_paused is time-based."""
+        from fastapi.responses import JSONResponse
+
+        with patch(
+            "app.routes.tasks.sse_response", return_value=JSONResponse({})
+        ) as mock_sse:
+            client.get("/api/tasks/stats", headers={"Accept": "text/event-stream"})
+
+        mock_sse.assert_called_once()
+        assert mock_sse.call_args.kwargs.get("cache_key") is None
+
 
 class TestTriggerListSync:
     """Tests for POST /api/tasks/sync/list/{list_id}."""